@@ -17,7 +17,8 @@ Subcommands: extract, build, verify, gui (default).
 #     ._struct / ._array / ._map     per-type handlers
 #     ._set / ._bool / ._simple
 #   _find_property_start(data)       locate first property after header
-#   _verify_file(path, verbose)      verify a single file
+#   _verify_file(path, verbose)      mmap a file and verify it
+#   _verify_data(path, data, verbose)  verify an in-memory buffer
 # cmd_verify(args)                   verify one or more files
 #
 # GUI:
@@ -42,18 +43,49 @@ Subcommands: extract, build, verify, gui (default).
 #
 
 import argparse
+import concurrent.futures
+import contextlib
+import hashlib
 import io
 import json
+import mmap
 import os
+import re
 import struct
 import sys
 import threading
+from functools import lru_cache
+from itertools import islice
 
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
                                 'asaplayerlocaldatafixer'))
 from asa import PlayerLocalData
 from binary import BinaryStream
 
+# Optional accelerator: orjson parses/serialises several times faster
+# than stdlib json on the multi-MB documents the GUI round-trips.  The
+# tool stays fully functional without it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(text):
+    """json.loads, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _dumps(d):
+    """Pretty-print with 2-space indent, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(
+            d, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode('utf-8')
+    return json.dumps(d, indent=2, ensure_ascii=False)
+
 
 def cmd_extract(args):
     """Extract a .arkprofile to JSON."""
@@ -63,10 +95,10 @@ def cmd_extract(args):
 
     out_path = args.output or args.input + '.json'
     pld = PlayerLocalData(args.input)
-    json_str = pld.to_json(indent=args.indent)
 
-    with open(out_path, 'w', encoding='utf-8') as f:
-        f.write(json_str)
+    # Stream straight to disk; no intermediate multi-MB JSON string.
+    with open(out_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        pld.write_json(f, indent=args.indent)
 
     print(f'Extracted {os.path.basename(args.input)} -> {out_path}')
     return 0
@@ -85,10 +117,9 @@ def cmd_build(args):
     else:
         out_path = os.path.splitext(args.input)[0] + '.arkprofile'
 
-    with open(args.input, 'r', encoding='utf-8') as f:
-        json_str = f.read()
-
-    pld = PlayerLocalData.from_json(json_str)
+    # Parse straight from the stream; no full-file string first.
+    with open(args.input, 'r', encoding='utf-8', buffering=1 << 20) as f:
+        pld = PlayerLocalData.from_json_file(f)
     pld.save(out_path)
 
     print(f'Built {out_path} from {os.path.basename(args.input)}')
@@ -99,7 +130,7 @@ def _read_ntstring(data, pos):
     """Read a UE4 length-prefixed null-terminated string."""
     if pos + 4 > len(data):
         return (None, pos)
-    slen = struct.unpack_from('<I', data, pos)[0]
+    slen = _S_U32.unpack_from(data, pos)[0]
     pos += 4
     if slen == 0:
         return ('', pos)
@@ -108,37 +139,81 @@ def _read_ntstring(data, pos):
     return (s, pos)
 
 
+# Pre-compiled Struct instances; consecutive int32 header fields are
+# unpacked in one call instead of several '<i' unpacks that each
+# re-parse the format string.
+_S_I = struct.Struct('<i')
+_S_U32 = struct.Struct('<I')
+_S_II = struct.Struct('<ii')
+_S_IIB = struct.Struct('<iiB')
+
+
+# Delete-table for bytes.translate: a name is valid when deleting every
+# printable-ASCII byte leaves nothing behind.
+_PRINTABLE_ASCII = bytes(range(32, 127))
+
+
+# Known property type names, hoisted so _read_pair does not rebuild the
+# set on every call.  Interned to match the sys.intern'd ptype strings.
+_VALID_TYPES = frozenset(map(sys.intern, (
+    'StructProperty', 'ArrayProperty', 'MapProperty', 'SetProperty',
+    'BoolProperty', 'IntProperty', 'UInt32Property', 'FloatProperty',
+    'DoubleProperty', 'Int64Property', 'UInt64Property', 'Int16Property',
+    'UInt16Property', 'ByteProperty', 'StrProperty', 'NameProperty',
+    'ObjectProperty', 'SoftObjectProperty',
+)))
+
+# (ntstring length incl. terminator, first byte) -> [(raw bytes, name)].
+# Lets _read_pair reject or match a type with one dict probe and a short
+# bytes compare, never decoding the slice to str.
+_PTYPE_BY_LEN_FIRST = {}
+for _t in sorted(_VALID_TYPES):
+    _raw = _t.encode('ascii')
+    _PTYPE_BY_LEN_FIRST.setdefault((len(_raw) + 1, _raw[0]), []).append((_raw, _t))
+del _t, _raw
+
+
 def _read_pair(data, pos, end):
     """Read a (name, type) pair."""
     if pos + 4 > end:
         return (None, None, pos)
+    # Validate the name on the raw bytes before decoding anything:
+    # translate with the printable-ASCII delete table is a C loop, and a
+    # bogus name is rejected without ever building a str object.
+    slen = _S_U32.unpack_from(data, pos)[0]
+    if slen > 201:
+        return (None, None, pos)
+    if slen and data[pos + 4:pos + 4 + slen - 1].translate(None, _PRINTABLE_ASCII):
+        return (None, None, pos)
     name, npos = _read_ntstring(data, pos)
     if name is None:
         return (None, None, pos)
     if name == 'None':
         return (name, None, npos)
-    if len(name) > 200 or not all(32 <= ord(c) < 127 for c in name):
-        return (None, None, pos)
-    if npos + 4 > end:
+    if npos + 5 > end:
         return (None, None, pos)
-    ptype, tpos = _read_ntstring(data, npos)
-    if ptype is None:
-        return (None, None, pos)
-    valid_types = {
-        'StructProperty', 'ArrayProperty', 'MapProperty', 'SetProperty',
-        'BoolProperty', 'IntProperty', 'UInt32Property', 'FloatProperty',
-        'DoubleProperty', 'Int64Property', 'UInt64Property', 'Int16Property',
-        'UInt16Property', 'ByteProperty', 'StrProperty', 'NameProperty',
-        'ObjectProperty', 'SoftObjectProperty',
-    }
-    if ptype not in valid_types:
+    # Match the type against the raw bytes: (length, first byte) narrows
+    # the 18 known names to one or two candidates, and a bytes compare
+    # replaces the decode + set lookup.  Hits return the interned module
+    # constant, so the handler-dict lookup is a pointer-equality hit.
+    tlen = _S_U32.unpack_from(data, npos)[0]
+    cands = _PTYPE_BY_LEN_FIRST.get((tlen, data[npos + 4]))
+    if cands is None:
         return (None, None, pos)
-    return (name, ptype, tpos)
+    raw = data[npos + 4:npos + 4 + tlen - 1]
+    for braw, ptype in cands:
+        if raw == braw:
+            return (name, ptype, npos + 4 + tlen)
+    return (None, None, pos)
 
 
 class _Verifier:
     def __init__(self, data, verbose=False):
-        self.data = data
+        # Scalar/tag reads go through a memoryview, whose indexing is
+        # cheaper than bytes.__getitem__; the original buffer is kept for
+        # the slices that _read_ntstring/_read_pair need to decode.
+        self.data = memoryview(data).cast('B')
+        self._raw = data
         self.verbose = verbose
         self.errors = []
         self.props_checked = 0
@@ -154,33 +229,33 @@ class _Verifier:
 
     def verify_properties(self, start, end, depth=0):
         pos = start
+        data = self._raw
+        handler_get = _HANDLERS_BY_TYPE.get
+        simple = _Verifier._simple
+        # Count in a local and flush once on exit; the attribute
+        # load/store pair per property adds up over big profiles.
+        checked = 0
         while pos < end:
-            name, ptype, new_pos = _read_pair(self.data, pos, end)
+            name, ptype, new_pos = _read_pair(data, pos, end)
             if name is None:
-                return pos
-            pos = new_pos
+                break
             if name == 'None':
+                pos = new_pos
                 break
-            self.props_checked += 1
-            handler = {
-                'StructProperty': self._struct,
-                'ArrayProperty': self._array,
-                'MapProperty': self._map,
-                'SetProperty': self._set,
-                'BoolProperty': self._bool,
-            }.get(ptype, self._simple)
-            pos = handler(name, ptype, pos, depth)
+            pos = new_pos
+            checked += 1
+            pos = handler_get(ptype, simple)(self, name, ptype, pos, depth)
+        self.props_checked += checked
         return pos
 
     # -- property handlers --------------------------------------------------
 
     def _struct(self, name, ptype, pos, depth):
-        _f1 = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
-        struct_name, pos = _read_ntstring(self.data, pos)
-        _f2 = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
-        package, pos = _read_ntstring(self.data, pos)
-        idx = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
-        dsz = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
+        _f1 = _S_I.unpack_from(self.data, pos)[0]; pos += 4
+        struct_name, pos = _read_ntstring(self._raw, pos)
+        _f2 = _S_I.unpack_from(self.data, pos)[0]; pos += 4
+        package, pos = _read_ntstring(self._raw, pos)
+        idx, dsz = _S_II.unpack_from(self.data, pos); pos += 8
         tag = self.data[pos]; pos += 1
         expected_end = pos + dsz
         self.log(depth, f'Struct {name} ({struct_name}) declared_size={dsz} [{pos}..{expected_end})')
@@ -191,17 +266,16 @@ class _Verifier:
         return expected_end
 
     def _array(self, name, ptype, pos, depth):
-        _f = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
-        child_type, pos = _read_ntstring(self.data, pos)
+        _f = _S_I.unpack_from(self.data, pos)[0]; pos += 4
+        child_type, pos = _read_ntstring(self._raw, pos)
         if child_type == 'StructProperty':
-            _f2 = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
-            _sn, pos = _read_ntstring(self.data, pos)
-            _f3 = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
-            _pkg, pos = _read_ntstring(self.data, pos)
-        idx = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
-        dsz = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
+            _f2 = _S_I.unpack_from(self.data, pos)[0]; pos += 4
+            _sn, pos = _read_ntstring(self._raw, pos)
+            _f3 = _S_I.unpack_from(self.data, pos)[0]; pos += 4
+            _pkg, pos = _read_ntstring(self._raw, pos)
+        idx, dsz = _S_II.unpack_from(self.data, pos); pos += 8
         tag = self.data[pos]; pos += 1
-        length = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
+        length = _S_I.unpack_from(self.data, pos)[0]; pos += 4
         elem_data_size = dsz - 4
         expected_end = pos + elem_data_size
         self.log(depth, f'Array {name} [{child_type}] declared_size={dsz} length={length}')
@@ -212,12 +286,18 @@ class _Verifier:
             self.error(depth, f'{name}: size {dsz} < 4')
             return pos
         if child_type == 'StructProperty' and length > 0:
+            # ArkItems/ArkTamedDinosData can run to thousands of elements;
+            # hoist the lookups so each iteration is just the separator
+            # check plus the recursive walk.
             ep = pos
+            data = self.data
+            verify = self.verify_properties
+            unpack_u32 = _S_U32.unpack_from
             for i in range(length):
                 if i > 0 and ep + 4 <= expected_end:
-                    if struct.unpack_from('<I', self.data, ep)[0] == 0:
+                    if unpack_u32(data, ep)[0] == 0:
                         ep += 4
-                ep = self.verify_properties(ep, expected_end, depth + 1)
+                ep = verify(ep, expected_end, depth + 1)
                 if ep > expected_end:
                     self.error(depth, f'{name}[{i}]: overran array boundary')
                     break
@@ -235,11 +315,10 @@ class _Verifier:
         return expected_end
 
     def _map(self, name, ptype, pos, depth):
-        _fk = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
-        key_type, pos = _read_ntstring(self.data, pos)
-        val_type, pos = _read_ntstring(self.data, pos)
-        idx = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
-        dsz = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
+        _fk = _S_I.unpack_from(self.data, pos)[0]; pos += 4
+        key_type, pos = _read_ntstring(self._raw, pos)
+        val_type, pos = _read_ntstring(self._raw, pos)
+        idx, dsz = _S_II.unpack_from(self.data, pos); pos += 8
         tag = self.data[pos]; pos += 1
         expected_end = pos + dsz
         self.log(depth, f'Map {name} [{key_type}->{val_type}] size={dsz}')
@@ -249,10 +328,9 @@ class _Verifier:
         return expected_end
 
     def _set(self, name, ptype, pos, depth):
-        _f = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
-        elem_type, pos = _read_ntstring(self.data, pos)
-        idx = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
-        dsz = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
+        _f = _S_I.unpack_from(self.data, pos)[0]; pos += 4
+        elem_type, pos = _read_ntstring(self._raw, pos)
+        idx, dsz = _S_II.unpack_from(self.data, pos); pos += 8
         tag = self.data[pos]; pos += 1
         expected_end = pos + dsz
         self.log(depth, f'Set {name} [{elem_type}] size={dsz}')
@@ -262,20 +340,19 @@ class _Verifier:
         return expected_end
 
     def _bool(self, name, ptype, pos, depth):
-        idx = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
-        _sz = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
-        val = self.data[pos]; pos += 1
+        idx, _sz, val = _S_IIB.unpack_from(self.data, pos); pos += 9
         if _sz != 0:
             self.error(depth, f'BoolProperty {name}: size should be 0, got {_sz}')
         self.log(depth, f'Bool {name} = {val}')
         return pos
 
     def _simple(self, name, ptype, pos, depth):
-        idx = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
-        dsz = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
+        # Fallback for var-length scalar types; fixed-size types go
+        # through the specialised closures in _HANDLERS_BY_TYPE.
+        idx, dsz = _S_II.unpack_from(self.data, pos); pos += 8
         tag = self.data[pos]; pos += 1
         if tag:
-            _extra = struct.unpack_from('<i', self.data, pos)[0]; pos += 4
+            _extra = _S_I.unpack_from(self.data, pos)[0]; pos += 4
         expected_end = pos + dsz
         self.log(depth, f'{ptype} {name} size={dsz}')
         if dsz < 0:
@@ -284,39 +361,107 @@ class _Verifier:
         if expected_end > len(self.data):
             self.error(depth, f'{name} ({ptype}): size {dsz} overflows file')
             return min(expected_end, len(self.data))
-        expected_sizes = {
-            'IntProperty': 4, 'UInt32Property': 4, 'FloatProperty': 4,
-            'DoubleProperty': 8, 'Int64Property': 8, 'UInt64Property': 8,
-            'Int16Property': 2, 'UInt16Property': 2,
-        }
-        if ptype in expected_sizes and dsz != expected_sizes[ptype]:
-            self.error(depth, f'{name} ({ptype}): expected size {expected_sizes[ptype]}, got {dsz}')
         return expected_end
 
 
+def _make_simple(expected_size):
+    """Build a scalar handler with the type's expected size baked in.
+
+    The generated closure checks ``expected_size`` as a local instead of
+    probing a size dict per call; it mirrors ``_Verifier._simple``
+    otherwise.
+    """
+    def handler(self, name, ptype, pos, depth):
+        idx, dsz = _S_II.unpack_from(self.data, pos); pos += 8
+        tag = self.data[pos]; pos += 1
+        if tag:
+            _extra = _S_I.unpack_from(self.data, pos)[0]; pos += 4
+        expected_end = pos + dsz
+        self.log(depth, f'{ptype} {name} size={dsz}')
+        if dsz < 0:
+            self.error(depth, f'{name} ({ptype}): negative size {dsz}')
+            return pos
+        if expected_end > len(self.data):
+            self.error(depth, f'{name} ({ptype}): size {dsz} overflows file')
+            return min(expected_end, len(self.data))
+        if dsz != expected_size:
+            self.error(depth, f'{name} ({ptype}): expected size {expected_size}, got {dsz}')
+        return expected_end
+    return handler
+
+
+# Per-type handlers, hoisted so verify_properties does not rebuild the
+# dict per property.  Unbound functions; callers pass the verifier.
+# Fixed-size scalar types get a closure specialised on their expected
+# size; var-length ones fall back to _Verifier._simple.
+_HANDLERS_BY_TYPE = {
+    'StructProperty': _Verifier._struct,
+    'ArrayProperty': _Verifier._array,
+    'MapProperty': _Verifier._map,
+    'SetProperty': _Verifier._set,
+    'BoolProperty': _Verifier._bool,
+}
+for _t, _sz in (('IntProperty', 4), ('UInt32Property', 4),
+                ('FloatProperty', 4), ('DoubleProperty', 8),
+                ('Int64Property', 8), ('UInt64Property', 8),
+                ('Int16Property', 2), ('UInt16Property', 2)):
+    _HANDLERS_BY_TYPE[_t] = _make_simple(_sz)
+del _t, _sz
+
+
 def _find_property_start(data):
-    """Replay header reading to find where properties begin."""
-    pos = 12  # header_v1, v2, v3
-    version = struct.unpack_from('<i', data, pos)[0]; pos += 4
-    pos += 16  # guid
-    _, pos = _read_ntstring(data, pos)  # file_type
+    """Replay header reading to find where properties begin.
+
+    Only ``name`` is actually needed, so the other header strings are
+    skipped by their length prefix without decoding.  Raises ValueError
+    when the header is truncated or a length prefix runs past the end,
+    so the verifier can report it instead of crashing.
+    """
+    n = len(data)
+
+    def skip_str(pos):
+        if pos + 4 > n:
+            raise ValueError(f'truncated header at offset {pos}')
+        end = pos + 4 + _S_U32.unpack_from(data, pos)[0]
+        if end > n:
+            raise ValueError(f'header string at offset {pos} runs past '
+                             f'end of file')
+        return end
+
+    pos = 12 + 4 + 16  # header_v1..v3, version, guid
+    pos = skip_str(pos)  # file_type
     pos += 8   # two int32s
-    name, pos = _read_ntstring(data, pos)
-    _, pos = _read_ntstring(data, pos)  # controller
-    _, pos = _read_ntstring(data, pos)  # game_mode
-    _, pos = _read_ntstring(data, pos)  # map_name
-    _, pos = _read_ntstring(data, pos)  # map_path
-    pos += 12  # zeros
-    pos += 4   # header_size
-    pos += 4   # always 0
-    pos += 1   # ASA extra separator
+    if pos + 4 > n:
+        raise ValueError(f'truncated header at offset {pos}')
+    slen = _S_U32.unpack_from(data, pos)[0]
+    if pos + 4 + slen > n:
+        raise ValueError(f'header string at offset {pos} runs past '
+                         f'end of file')
+    name = data[pos + 4:pos + 3 + slen].decode('ascii', errors='replace')
+    pos += 4 + slen
+    for _ in range(4):  # controller, game_mode, map_name, map_path
+        pos = skip_str(pos)
+    pos += 21  # 12 zero bytes, header_size, always-0, ASA extra separator
     return pos, name
 
 
 def _verify_file(path, verbose=False):
+    # Map the file instead of slurping it; unpack_from and slicing work on
+    # mmap objects unchanged.  Empty files and exotic filesystems can't be
+    # mapped, so fall back to a plain read for those.
     with open(path, 'rb') as f:
-        data = f.read()
-
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            data = f.read()
+    try:
+        return _verify_data(path, data, verbose)
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+
+def _verify_data(path, data, verbose=False):
     print(f'File: {path} ({len(data):,} bytes)')
 
     if len(data) < 50:
@@ -327,11 +472,21 @@ def _verify_file(path, verbose=False):
     header_size = struct.unpack_from('<i', data, 4)[0]
     print(f'  Header: save_version={save_version}, header_size={header_size}')
 
-    prop_start, name = _find_property_start(data)
+    try:
+        prop_start, name = _find_property_start(data)
+    except ValueError as e:
+        print(f'ERROR: malformed header: {e}', file=sys.stderr)
+        return False
     print(f'  Name: {name}')
     print(f'  Properties start at byte {prop_start}')
     v = _Verifier(data, verbose=verbose)
-    end_pos = v.verify_properties(prop_start, len(data))
+    try:
+        end_pos = v.verify_properties(prop_start, len(data))
+    finally:
+        # Drop the verifier's view over the buffer even when the walk
+        # raises: a traceback keeping it alive would turn _verify_file's
+        # mmap close into a BufferError that masks the real diagnostic.
+        v.data.release()
 
     remaining = len(data) - end_pos
     if remaining == 20:
@@ -352,21 +507,143 @@ def _verify_file(path, verbose=False):
         return True
 
 
-def cmd_verify(args):
-    """Verify property sizes in .arkprofile file(s)."""
-    all_ok = True
-    for path in args.input:
+def _verify_file_wrapper(path, verbose=False):
+    """Verify one file with its report captured; picklable pool task."""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
         if not os.path.isfile(path):
             print(f'Error: file not found: {path}', file=sys.stderr)
-            all_ok = False
-            continue
-        ok = _verify_file(path, verbose=args.verbose)
-        if not ok:
-            all_ok = False
+            ok = False
+        else:
+            # One corrupt file must not abort the whole pool run; keep
+            # the failure in this file's report and verify the rest.
+            try:
+                ok = _verify_file(path, verbose=verbose)
+            except Exception as e:
+                print(f'ERROR: verification failed: {e}', file=sys.stderr)
+                ok = False
+    return ok, buf.getvalue()
+
+
+def cmd_verify(args):
+    """Verify property sizes in .arkprofile file(s)."""
+    paths = args.input
+    if len(paths) == 1:
+        # Common single-file case: skip the pool startup cost.
+        if not os.path.isfile(paths[0]):
+            print(f'Error: file not found: {paths[0]}', file=sys.stderr)
+            return 1
+        ok = _verify_file(paths[0], verbose=args.verbose)
         print()
+        return 0 if ok else 1
+
+    # Verifying many profiles (e.g. every player slot on a server) is
+    # embarrassingly parallel: one worker process per file, reports
+    # printed in input order once each worker finishes.
+    all_ok = True
+    workers = min(len(paths), os.cpu_count() or 1)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as ex:
+        for ok, report in ex.map(_verify_file_wrapper, paths,
+                                 [args.verbose] * len(paths)):
+            print(report, end='' if report.endswith('\n') else '\n')
+            print()
+            if not ok:
+                all_ok = False
     return 0 if all_ok else 1
 
 
+def _common_affix(old, new):
+    """Return (prefix, suffix) lengths shared by two strings.
+
+    Compares in 64 KiB slices (C memcmp) before falling back to chars,
+    and caps the suffix so the two spans never overlap.
+    """
+    n = min(len(old), len(new))
+    block = 1 << 16
+    p = 0
+    while p < n and old[p:p + block] == new[p:p + block]:
+        p += block
+    if p > n:
+        p = n
+    end = min(p + block, n)
+    while p < end and old[p] == new[p]:
+        p += 1
+    m = n - p
+    s = 0
+    while (s + block <= m and
+           old[len(old) - s - block:len(old) - s]
+           == new[len(new) - s - block:len(new) - s]):
+        s += block
+    end = min(s + block, m)
+    while s < end and old[len(old) - 1 - s] == new[len(new) - 1 - s]:
+        s += 1
+    return p, s
+
+
+def _match_braces(text, start):
+    """Return the index just past the object opened at text[start].
+
+    String-aware: quote and backslash handling mirrors the JSON grammar,
+    so braces inside string values never confuse the depth count.
+    Returns -1 when the object is unterminated.
+    """
+    depth = 0
+    in_str = False
+    i = start
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if in_str:
+            if c == '\\':
+                i += 2
+                continue
+            if c == '"':
+                in_str = False
+        elif c == '"':
+            in_str = True
+        elif c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return -1
+
+
+def _splice_array_value(text, path, new_literal):
+    """Replace one object literal inside a serialized JSON document.
+
+    Walks *path* (a tuple of dict keys) with regex anchors and
+    _match_braces instead of parsing the document, then splices
+    *new_literal* over the old object's span.  Re-serializing a large
+    profile is dominated by the unchanged siblings; this touches only
+    the edited subtree.  Returns None when an anchor cannot be found
+    (hand-edited text) so callers can fall back to a full dump.
+    """
+    lo, hi = 0, len(text)
+    start = end = -1
+    for key in path:
+        m = re.compile(r'"%s"\s*:\s*\{' % re.escape(key)).search(text, lo, hi)
+        if m is None:
+            return None
+        start = m.end() - 1
+        end = _match_braces(text, start)
+        if end < 0:
+            return None
+        lo, hi = start + 1, end - 1
+    # Re-indent the literal's continuation lines to the anchor line's
+    # depth; escaped newlines inside strings are untouched by design.
+    line_start = text.rfind('\n', 0, start) + 1
+    i = line_start
+    while text[i] in ' \t':
+        i += 1
+    indent = text[line_start:i]
+    if indent:
+        new_literal = new_literal.replace('\n', '\n' + indent)
+    return text[:start] + new_literal + text[end:]
+
+
 def cmd_gui(args):
     """Launch the graphical profile editor."""
     import tkinter as tk
@@ -376,12 +653,27 @@ def cmd_gui(args):
         return path if len(path) <= max_len else '...' + path[-(max_len - 3):]
 
     def _array_summary(entry):
-        if not isinstance(entry, dict):
+        if type(entry) is not dict:
             return str(entry)[:80]
         length = entry.get('length', len(entry.get('value', [])))
         child = entry.get('_child_type', '?')
         return f'{length} × {child}'
 
+    # Preview formatting keyed on the value's exact type: one dict probe
+    # per node instead of an isinstance cascade.  bool needs its own
+    # entry since type() does not follow the int subclass relation.
+    _FMT_BY_TYPE = {
+        int: lambda v: str(v)[:120],
+        float: lambda v: str(v)[:120],
+        bool: lambda v: str(v)[:120],
+        str: lambda v: v[:120],
+        dict: lambda v: f'{{{len(v)} keys}}',
+        list: lambda v: f'[{len(v)} items]',
+    }
+
+    def _fmt_fallback(v):
+        return str(v)[:80]
+
     # -- application --------------------------------------------------------
 
     class App(tk.Tk):
@@ -393,9 +685,25 @@ def cmd_gui(args):
             self.pld = None
             self.json_path = None
             self.dirty = False
+            self._json_cache = None
+            self._json_dict = None
+            self._json_dict_src = None
+            self._node_refs = {}
+            self._node_seq = 0
+            self._dirty_after_id = None
+            self._last_applied_hash = None
+            self._text_snapshot = None
+            self._in_programmatic_edit = False
             self._build_ui()
 
         def _build_ui(self):
+            # Pre-registered styles for the JSON status label: switching
+            # the style name is one cheap option set, while a foreground=
+            # config resolves and rebuilds the widget's style each time.
+            style = ttk.Style()
+            style.configure('Dirty.TLabel', foreground='orange')
+            style.configure('Clean.TLabel', foreground='green')
+
             menubar = tk.Menu(self)
             file_menu = tk.Menu(menubar, tearoff=0)
             file_menu.add_command(label='Open .arkprofile…', command=self._open_profile,
@@ -464,17 +772,19 @@ def cmd_gui(args):
             self.tree.column('value', width=400, minwidth=100)
             tree_scroll_y.config(command=self.tree.yview)
             self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            self.tree.bind('<<TreeviewOpen>>', self._on_tree_open)
 
             # JSON tab
             json_frame = ttk.Frame(self.notebook)
             self.notebook.add(json_frame, text='  JSON  ')
             json_toolbar = ttk.Frame(json_frame, padding=(0, 2))
             json_toolbar.pack(side=tk.TOP, fill=tk.X)
-            ttk.Button(json_toolbar, text='Apply Changes', command=self._apply_json).pack(
-                side=tk.LEFT, padx=4)
+            self._btn_apply = ttk.Button(json_toolbar, text='Apply Changes',
+                                         command=self._apply_json)
+            self._btn_apply.pack(side=tk.LEFT, padx=4)
             ttk.Button(json_toolbar, text='Reformat', command=self._reformat_json).pack(
                 side=tk.LEFT, padx=4)
-            self.lbl_json_status = ttk.Label(json_toolbar, text='', foreground='gray')
+            self.lbl_json_status = ttk.Label(json_toolbar, text='')
             self.lbl_json_status.pack(side=tk.RIGHT, padx=4)
             json_scroll = ttk.Scrollbar(json_frame, orient=tk.VERTICAL)
             json_scroll.pack(side=tk.RIGHT, fill=tk.Y)
@@ -516,30 +826,38 @@ def cmd_gui(args):
 
         def _load_pld(self, pld, source_label):
             self.pld = pld
+            self._json_cache = None
+            self._last_applied_hash = None
             self.lbl_file.config(text=source_label)
-            self._refresh_summary()
-            self._refresh_tree()
+            self._refresh_all()
             self._refresh_json()
             self._log(f'Loaded: {source_label}')
 
-        def _refresh_summary(self):
+        def _refresh_all(self):
+            """Refresh the summary labels and the tree in one pass.
+
+            Both panes read from the same profile state, and every caller
+            updated them together anyway; fusing them means one walk over
+            the top-level containers per refresh instead of two.
+            """
+            labels = self._summary_labels
+            self.tree.delete(*self.tree.get_children())
+            self._node_refs = {}
+            self._node_seq = 0
             pld = self.pld
             if pld is None:
-                for v in self._summary_labels.values():
+                for v in labels.values():
                     v.config(text='–')
                 return
-            self._summary_labels['name'].config(text=pld.name or '–')
-            self._summary_labels['map'].config(text=pld.map_name or '–')
-            self._summary_labels['items'].config(text=str(len(pld.ark_items)))
-            self._summary_labels['dinos'].config(text=str(len(pld.tamed_dinos)))
-            self._summary_labels['achievements'].config(text=str(len(pld.achievements)))
-
-        def _refresh_tree(self):
-            self.tree.delete(*self.tree.get_children())
-            if self.pld is None:
-                return
-            self._insert_tree_node('', 'header', self._header_dict(), 'header')
-            self._insert_tree_node('', 'data', self.pld.data, 'data')
+            labels['name'].config(text=pld.name or '–')
+            labels['map'].config(text=pld.map_name or '–')
+            labels['items'].config(text=str(len(pld.ark_items)))
+            labels['dinos'].config(text=str(len(pld.tamed_dinos)))
+            labels['achievements'].config(text=str(len(pld.achievements)))
+            for key, value in (('header', self._header_dict()),
+                               ('data', pld.data)):
+                iid = self._insert_node('', key, value, open_=True)
+                self._populate_children(iid)
 
         def _header_dict(self):
             pld = self.pld
@@ -550,54 +868,81 @@ def cmd_gui(args):
                 'map_path': pld.map_path, 'header_size': pld.header_size,
             }
 
-        def _insert_tree_node(self, parent, key, value, node_id=None):
-            kw = {'iid': node_id} if node_id else {}
+        def _insert_node(self, parent, key, value, open_=False):
+            """Insert one row; container children materialise lazily.
+
+            Non-empty dicts/lists get a single '…' placeholder child and a
+            reference in _node_refs, so only the visible slice of a huge
+            ArkItems/dino tree ever turns into Treeview rows.
+            """
+            self._node_seq += 1
+            iid = str(self._node_seq)
             if isinstance(value, dict):
                 ptype = value.get('_type', 'dict')
                 if 'value' in value and '_type' in value:
                     display = self._value_preview(value)
                 else:
                     display = f'{{{len(value)} keys}}'
-                n = self.tree.insert(parent, tk.END, text=key,
-                                     values=(ptype, display), open=(parent == ''), **kw)
+                self.tree.insert(parent, tk.END, iid=iid, text=key,
+                                 values=(ptype, display), open=open_)
+            elif isinstance(value, list):
+                self.tree.insert(parent, tk.END, iid=iid, text=key,
+                                 values=('list', f'[{len(value)} items]'),
+                                 open=open_)
+            else:
+                self.tree.insert(parent, tk.END, iid=iid, text=key,
+                                 values=(type(value).__name__, str(value)[:200]))
+                return iid
+            if value:
+                self._node_refs[iid] = value
+                self.tree.insert(iid, tk.END, iid=iid + '.__lazy', text='…')
+            return iid
+
+        def _populate_children(self, iid):
+            """Replace a row's lazy placeholder with its real children."""
+            value = self._node_refs.pop(iid, None)
+            if value is None:
+                return
+            self.tree.delete(iid + '.__lazy')
+            if isinstance(value, dict):
                 for k, v in value.items():
                     if k.startswith('_'):
-                        self.tree.insert(n, tk.END, text=k, values=('meta', str(v)[:120]))
+                        self.tree.insert(iid, tk.END, text=k,
+                                         values=('meta', str(v)[:120]))
                     else:
-                        self._insert_tree_node(n, k, v)
-            elif isinstance(value, list):
-                n = self.tree.insert(parent, tk.END, text=key,
-                                     values=('list', f'[{len(value)} items]'), **kw)
-                for i, v in enumerate(value[:200]):
-                    self._insert_tree_node(n, f'[{i}]', v)
+                        self._insert_node(iid, k, v)
+            else:
+                # islice iterates in place; value[:200] would copy up to
+                # 200 references per list node just to throw them away.
+                for i, v in enumerate(islice(value, 200)):
+                    self._insert_node(iid, f'[{i}]', v)
                 if len(value) > 200:
-                    self.tree.insert(n, tk.END, text=f'... +{len(value) - 200} more',
+                    self.tree.insert(iid, tk.END,
+                                     text=f'... +{len(value) - 200} more',
                                      values=('', ''))
-            else:
-                self.tree.insert(parent, tk.END, text=key,
-                                 values=(type(value).__name__, str(value)[:200]), **kw)
+
+        def _on_tree_open(self, event=None):
+            self._populate_children(self.tree.focus())
 
         def _value_preview(self, entry):
-            ptype = entry.get('_type', '')
-            val = entry.get('value')
-            if ptype == 'ArrayProperty':
+            if entry.get('_type', '') == 'ArrayProperty':
                 return _array_summary(entry)
-            if isinstance(val, (int, float, str, bool)):
-                return str(val)[:120]
-            if isinstance(val, dict):
-                return f'{{{len(val)} keys}}'
-            if isinstance(val, list):
-                return f'[{len(val)} items]'
-            return str(val)[:80]
+            val = entry.get('value')
+            return _FMT_BY_TYPE.get(type(val), _fmt_fallback)(val)
 
         def _refresh_json(self):
             if self.pld is None:
                 return
+            # Re-serialising a multi-MB profile on every refresh is the
+            # slow part; reuse the last string until something changes it.
+            if self._json_cache is None:
+                self._json_cache = self.pld.to_json(indent=2)
+            self._text_snapshot = None
             self.txt_json.delete('1.0', tk.END)
-            self.txt_json.insert('1.0', self.pld.to_json(indent=2))
+            self.txt_json.insert('1.0', self._json_cache)
             self.txt_json.edit_modified(False)
             self.dirty = False
-            self.lbl_json_status.config(text='')
+            self._set_json_status('')
 
         def _open_profile(self):
             path = filedialog.askopenfilename(
@@ -656,16 +1001,16 @@ def cmd_gui(args):
             self._do_save_json(path)
 
         def _do_save_json(self, path):
-            text = self.txt_json.get('1.0', tk.END).strip()
+            text = self._editor_text()
             try:
-                with open(path, 'w', encoding='utf-8') as f:
+                with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
                     f.write(text)
             except Exception as e:
                 messagebox.showerror('Error', f'Failed to save:\n{e}')
                 return
             self.dirty = False
             self.txt_json.edit_modified(False)
-            self.lbl_json_status.config(text='')
+            self._set_json_status('')
             self._log(f'Saved JSON: {path}')
             self._status('Saved')
 
@@ -679,9 +1024,9 @@ def cmd_gui(args):
                 filetypes=[('ARK Profile', '*.arkprofile'), ('All files', '*.*')])
             if not path:
                 return
-            text = self.txt_json.get('1.0', tk.END).strip()
+            text = self._editor_text()
             try:
-                pld = PlayerLocalData.from_json(text)
+                pld = PlayerLocalData.from_dict(self._parse_editor_json(text))
                 pld.save(path)
             except Exception as e:
                 messagebox.showerror('Error', f'Build failed:\n{e}')
@@ -701,103 +1046,256 @@ def cmd_gui(args):
 
         def _run_verify(self, path):
             self.notebook.select(2)  # Log tab
+            app = self
+
+            class _LogWriter(io.TextIOBase):
+                """Forwards complete lines to the log as they appear,
+                so long verifications report progressively instead of
+                buffering everything until the end."""
+                _buf = ''
+
+                def write(self, s):
+                    self._buf += s
+                    while '\n' in self._buf:
+                        line, self._buf = self._buf.split('\n', 1)
+                        app.after(0, app._log, line)
+                    return len(s)
+
+                def close(self):
+                    if self._buf:
+                        app.after(0, app._log, self._buf)
+                        self._buf = ''
+                    super().close()
 
             def _worker():
+                out = _LogWriter()
                 try:
-                    import io as _io
-                    old_stdout, old_stderr = sys.stdout, sys.stderr
-                    sys.stdout = buf_out = _io.StringIO()
-                    sys.stderr = buf_err = _io.StringIO()
-                    try:
+                    with contextlib.redirect_stdout(out), \
+                            contextlib.redirect_stderr(out):
                         _verify_file(path, verbose=False)
-                    finally:
-                        sys.stdout, sys.stderr = old_stdout, old_stderr
-                    output = buf_out.getvalue() + buf_err.getvalue()
                 except Exception as e:
-                    output = f'Verification error: {e}'
-                self.after(0, lambda: self._log(output.strip()))
+                    out.write(f'Verification error: {e}\n')
+                out.close()
 
             threading.Thread(target=_worker, daemon=True).start()
 
-            threading.Thread(target=_worker, daemon=True).start()
+        def _editor_text(self):
+            """Current editor content without the full Tcl copy when
+            nothing changed since the last fetch.
+
+            Snapshots are only kept while the widget's modified flag is
+            clear: its False→True transition fires <<Modified>>, which
+            invalidates the cache, but edits made while the flag is
+            already set fire no event, so those reads are never cached.
+            """
+            if self._text_snapshot is not None:
+                return self._text_snapshot
+            text = self.txt_json.get('1.0', tk.END).strip()
+            if not self.txt_json.edit_modified():
+                self._text_snapshot = text
+            return text
+
+        def _set_editor_text(self, new_text):
+            """Splice new content into the editor, replacing only the
+            span that actually changed.
+
+            A wholesale delete+insert makes Tk retokenise and rewrap the
+            whole multi-MB buffer; a clear or reformat usually touches a
+            small region.
+            """
+            self._text_snapshot = None
+            old = self.txt_json.get('1.0', 'end-1c')
+            if old == new_text:
+                return
+            p, s = _common_affix(old, new_text)
+            self.txt_json.delete(f'1.0+{p}c', f'end-{s + 1}c')
+            if p + s < len(new_text):
+                self.txt_json.insert(f'1.0+{p}c',
+                                     new_text[p:len(new_text) - s])
+
+        def _parse_editor_json(self, text):
+            """Parse the editor text, reusing the last parse if unchanged.
+
+            Apply, Reformat and the clear tools all start from the same
+            textbox content; without this each click re-parses the full
+            multi-MB document.
+            """
+            if self._json_dict_src == text:
+                return self._json_dict
+            d = _loads(text)
+            self._json_dict_src = text
+            self._json_dict = d
+            return d
 
         def _on_json_modified(self, event=None):
-            if self.txt_json.edit_modified():
-                self.dirty = True
-                self.lbl_json_status.config(text='unsaved changes', foreground='orange')
+            # Programmatic edits (the clear tools) seed the caches
+            # themselves; their queued <<Modified>> event must not wipe
+            # them again.  Only user keystrokes invalidate here.
+            if self._in_programmatic_edit or not self.txt_json.edit_modified():
+                return
+            self._json_cache = None
+            self._json_dict = None
+            self._json_dict_src = None
+            self._text_snapshot = None
+            if self.dirty:
+                return  # label already shows unsaved changes
+            self.dirty = True
+            # Debounce the ttk label reconfigure: a large paste can fire
+            # a burst of modify events, and each config is a style
+            # lookup + redraw.
+            if self._dirty_after_id is not None:
+                self.after_cancel(self._dirty_after_id)
+            self._dirty_after_id = self.after(150, self._show_dirty_label)
+
+        def _set_json_status(self, text, style='TLabel'):
+            lbl = self.lbl_json_status
+            if lbl.cget('style') != style:
+                lbl.config(text=text, style=style)
+            elif lbl.cget('text') != text:
+                lbl.config(text=text)
+
+        def _end_programmatic_edit(self):
+            self._in_programmatic_edit = False
+
+        def _show_dirty_label(self):
+            self._dirty_after_id = None
+            if self.dirty:
+                self._set_json_status('unsaved changes', 'Dirty.TLabel')
 
         def _apply_json(self):
-            text = self.txt_json.get('1.0', tk.END).strip()
+            text = self._editor_text()
             if not text:
                 return
-            try:
-                pld = PlayerLocalData.from_json(text)
-            except Exception as e:
-                messagebox.showerror('Invalid JSON', f'Failed to parse:\n{e}')
-                self._log(f'JSON parse error: {e}')
+            # Repeated Apply clicks on unchanged text are a no-op: skip
+            # the re-parse and the full tree rebuild.
+            digest = hashlib.blake2b(text.encode('utf-8'),
+                                     digest_size=8).digest()
+            if digest == self._last_applied_hash:
+                self._set_json_status('applied', 'Clean.TLabel')
+                self._status('Applied')
                 return
+            # Parse on a worker thread so a multi-megabyte document does
+            # not freeze the mainloop; the result is marshalled back with
+            # after(), so all widget/state updates stay on the UI thread.
+            self.config(cursor='watch')
+            self._btn_apply.config(state=tk.DISABLED)
+
+            def _parse_worker():
+                try:
+                    d = _loads(text)
+                    pld = PlayerLocalData.from_dict(d)
+                except Exception as e:
+                    self.after(0, self._apply_failed, e)
+                else:
+                    self.after(0, self._apply_parsed, pld, d, text, digest)
+
+            threading.Thread(target=_parse_worker, daemon=True).start()
+
+        def _apply_parsed(self, pld, d, text, digest):
+            self.config(cursor='')
+            self._btn_apply.config(state=tk.NORMAL)
             self.pld = pld
-            self._refresh_summary()
-            self._refresh_tree()
+            self._json_cache = None
+            self._json_dict = d
+            self._json_dict_src = text
+            self._last_applied_hash = digest
+            self._refresh_all()
             self.dirty = False
             self.txt_json.edit_modified(False)
-            self.lbl_json_status.config(text='applied', foreground='green')
+            self._set_json_status('applied', 'Clean.TLabel')
             self._log('Applied JSON edits')
             self._status('Applied')
 
+        def _apply_failed(self, e):
+            self.config(cursor='')
+            self._btn_apply.config(state=tk.NORMAL)
+            messagebox.showerror('Invalid JSON', f'Failed to parse:\n{e}')
+            self._log(f'JSON parse error: {e}')
+
         def _reformat_json(self):
-            text = self.txt_json.get('1.0', tk.END).strip()
+            text = self._editor_text()
             if not text:
                 return
             try:
-                d = json.loads(text)
-                formatted = json.dumps(d, indent=2, ensure_ascii=False)
+                d = self._parse_editor_json(text)
+                if orjson is not None:
+                    formatted = _dumps(d)
+                else:
+                    # All-ASCII documents (the normal case for profiles)
+                    # take stdlib json's C escape path with
+                    # ensure_ascii=True; non-ASCII keeps the unescaped
+                    # output as before.
+                    formatted = json.dumps(d, indent=2,
+                                           ensure_ascii=text.isascii())
             except Exception as e:
                 messagebox.showerror('Invalid JSON', str(e))
                 return
-            self.txt_json.delete('1.0', tk.END)
-            self.txt_json.insert('1.0', formatted)
+            self._set_editor_text(formatted)
             self.txt_json.edit_modified(False)
 
-        def _clear_array(self, key_path, label):
+        # Constant key paths for the clear tools; walked as tuples, no
+        # per-click string splitting.
+        _ARK_ITEMS_PATH = ('data', 'MyArkData', 'data', 'ArkItems')
+        _TAMED_DINOS_PATH = ('data', 'MyArkData', 'data', 'ArkTamedDinosData')
+
+        def _clear_array(self, path, label):
             if self.pld is None:
                 messagebox.showwarning('No data', 'Load a profile first.')
                 return
-            text = self.txt_json.get('1.0', tk.END).strip()
+            text = self._editor_text()
             try:
-                d = json.loads(text)
+                d = self._parse_editor_json(text)
             except Exception as e:
                 messagebox.showerror('Invalid JSON', str(e))
                 return
             obj = d
-            keys = key_path.split('.')
-            for k in keys[:-1]:
+            for k in path[:-1]:
                 obj = obj[k]
-            target = obj[keys[-1]]
+            target = obj[path[-1]]
             old_len = target.get('length', len(target.get('value', [])))
             target['value'] = []
             target['length'] = 0
             target['_size'] = 4
-            text = json.dumps(d, indent=2, ensure_ascii=False)
-            self.txt_json.delete('1.0', tk.END)
-            self.txt_json.insert('1.0', text)
+            # Splice just the cleared array's object literal into the
+            # existing text instead of re-dumping the whole document.
+            literal = json.dumps(target, indent=2,
+                                 ensure_ascii=text.isascii())
+            spliced = _splice_array_value(text, path, literal)
+            if spliced is not None:
+                text = spliced
+            elif orjson is not None:
+                text = _dumps(d)
+            else:
+                # The edit only removes content and inserts ASCII tokens,
+                # so the source text decides whether stdlib json's C
+                # escape fast path (ensure_ascii=True) is lossless here.
+                text = json.dumps(d, indent=2, ensure_ascii=text.isascii())
+            # The <<Modified>> event these edits queue is delivered after
+            # this handler returns; keep the guard up until the event loop
+            # has drained it, then lower it from an idle callback.
+            self._in_programmatic_edit = True
+            self._set_editor_text(text)
             self.txt_json.edit_modified(True)
+            self.after_idle(self._end_programmatic_edit)
             self.dirty = True
+            # Reuse the already-mutated dict; no third parse of the text.
+            self._json_dict = d
+            self._json_dict_src = text
+            self._last_applied_hash = None
             try:
-                self.pld = PlayerLocalData.from_json(text)
-                self._refresh_summary()
-                self._refresh_tree()
+                self.pld = PlayerLocalData.from_dict(d)
+                self._refresh_all()
             except Exception:
                 pass
             self._log(f'Cleared {label}: {old_len} → 0')
             self._status(f'Cleared {label}')
-            self.lbl_json_status.config(text='unsaved changes', foreground='orange')
+            self._set_json_status('unsaved changes', 'Dirty.TLabel')
 
         def _clear_ark_items(self):
-            self._clear_array('data.MyArkData.data.ArkItems', 'ArkItems')
+            self._clear_array(self._ARK_ITEMS_PATH, 'ArkItems')
 
         def _clear_tamed_dinos(self):
-            self._clear_array('data.MyArkData.data.ArkTamedDinosData', 'Tamed Dinos')
+            self._clear_array(self._TAMED_DINOS_PATH, 'Tamed Dinos')
 
         def _on_close(self):
             if self.dirty:
@@ -814,7 +1312,9 @@ def cmd_gui(args):
     return 0
 
 
-def main():
+@lru_cache(maxsize=1)
+def _build_parser():
+    """Construct the argument parser once; reused on repeat main() calls."""
     parser = argparse.ArgumentParser(
         prog='asa_tool_localprofile',
         description='Unified tool for ASA PlayerLocalData.arkprofile files.')
@@ -839,17 +1339,22 @@ def main():
     # gui
     sub.add_parser('gui', help='Launch graphical editor')
 
-    args = parser.parse_args()
+    return parser
+
+
+_DISPATCH = {
+    'extract': cmd_extract,
+    'build': cmd_build,
+    'verify': cmd_verify,
+    'gui': cmd_gui,
+}
+
+
+def main():
+    args = _build_parser().parse_args()
     if args.command is None:
         args.command = 'gui'
-
-    dispatch = {
-        'extract': cmd_extract,
-        'build': cmd_build,
-        'verify': cmd_verify,
-        'gui': cmd_gui,
-    }
-    return dispatch[args.command](args)
+    return _DISPATCH[args.command](args)
 
 
 if __name__ == '__main__':
@@ -1,5 +1,14 @@
 """asaplayerlocaldatafixer – read and write ASA PlayerLocalData.arkprofile files."""
 
-from .asa import PlayerLocalData, parse_asa_properties, ASAParseError
+__all__ = ['PlayerLocalData', 'parse_asa_properties', 'ASAParseError',
+           'struct_array_column']
 
-__all__ = ['PlayerLocalData', 'parse_asa_properties', 'ASAParseError']
+
+def __getattr__(name):
+    # PEP 562 lazy import: asa pulls in json/uuid and builds its write
+    # dispatch tables at import time, so defer that work until a caller
+    # actually touches one of the exported names.
+    if name in __all__:
+        from . import asa
+        return getattr(asa, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -12,14 +12,54 @@ Key differences from ASE format:
   - New property types: SoftObjectProperty, SetProperty, MapProperty, NameProperty
 """
 
-import io
+import array
+import json
+import math
+import mmap
 import struct
+import sys
+import threading
 import warnings
+from functools import lru_cache
+from itertools import repeat
 
 try:
-    from binary import BinaryStream
+    from binary import (BinaryStream, BufferBinaryStream,
+                        ByteArrayBinaryStream)
 except ImportError:
-    from .binary import BinaryStream
+    from .binary import (BinaryStream, BufferBinaryStream,
+                         ByteArrayBinaryStream)
+
+
+# Pre-compiled little-endian scalars (avoid per-call format-string parsing)
+_STRUCT_I32 = struct.Struct('<i')
+_F64 = struct.Struct('<d')
+
+# Numeric array child types -> (struct format char, element byte size).
+# Used to decode whole arrays with a single bulk unpack.
+_BULK_FMT = {
+    'IntProperty':    ('i', 4),
+    'UInt32Property': ('I', 4),
+    'FloatProperty':  ('f', 4),
+    'DoubleProperty': ('d', 8),
+    'Int64Property':  ('q', 8),
+    'UInt64Property': ('Q', 8),
+    'Int16Property':  ('h', 2),
+    'UInt16Property': ('H', 2),
+    'ByteProperty':   ('B', 1),
+    'BoolProperty':   ('B', 1),
+}
+
+_BULK_STRUCT_CACHE = {}
+
+
+def _bulk_struct(char, length):
+    """Return a cached ``struct.Struct`` for *length* elements of *char*."""
+    key = (char, length)
+    s = _BULK_STRUCT_CACHE.get(key)
+    if s is None:
+        s = _BULK_STRUCT_CACHE[key] = struct.Struct('<%d%s' % (length, char))
+    return s
 
 
 class ASAParseError(Exception):
@@ -34,24 +74,27 @@ def _to_str(value):
     return value
 
 
+# ASA files repeat the same ~40 type strings and a small set of struct /
+# package names thousands of times; resolve short strings to a single
+# interned object so repeated reads skip the decode and later equality
+# checks compare by identity.
+_STR_CACHE = {}
+
+
 def _safe_read_nt_string(stream):
     """Read a null-terminated string, returning '' for zero-length entries."""
     length = stream.readUInt32()
     if length == 0:
         return ''
-    raw = stream.readBytes(length - 1)
-    stream.readByte()  # null terminator
-    if isinstance(raw, bytes):
-        return raw.decode('ascii', errors='replace')
-    return str(raw)
-
-
-def _read_byte_val(stream):
-    """Read a single byte and return it as an int (0-255)."""
-    b = stream.readByte()
-    if isinstance(b, bytes):
-        return b[0]
-    return int(b)
+    # One read covering payload + null terminator, then strip the latter.
+    raw = bytes(stream.readBytes(length)[:length - 1])
+    if length <= 64:
+        s = _STR_CACHE.get(raw)
+        if s is None:
+            s = _STR_CACHE[raw] = sys.intern(
+                raw.decode('ascii', errors='replace'))
+        return s
+    return raw.decode('ascii', errors='replace')
 
 
 # ---------------------------------------------------------------------------
@@ -79,7 +122,7 @@ def _read_asa_struct_header(stream):
     package = _safe_read_nt_string(stream)
     index = stream.readInt32()
     data_size = stream.readInt32()
-    tag = _read_byte_val(stream)         # property tag byte
+    tag = stream.readByte()         # property tag byte
     return (struct_name, package, index, data_size, tag)
 
 
@@ -101,7 +144,7 @@ def _read_asa_array_header(stream):
         package = _safe_read_nt_string(stream)
     index = stream.readInt32()
     data_size = stream.readInt32()
-    tag = _read_byte_val(stream)         # property tag byte
+    tag = stream.readByte()         # property tag byte
     length = stream.readInt32()
     return (child_type, s_name, package, index, data_size, tag, length)
 
@@ -114,7 +157,7 @@ def _read_asa_simple_header(stream):
     """
     index = stream.readInt32()
     size = stream.readInt32()
-    tag = _read_byte_val(stream)
+    tag = stream.readByte()
     extra = None
     if tag:
         extra = stream.readInt32()       # extra array index
@@ -125,23 +168,26 @@ def _read_asa_simple_header(stream):
 # ASA property value readers
 # ---------------------------------------------------------------------------
 
+# Scalar property types -> BinaryStream reader method name.  Looked up
+# as a bound method per call, avoiding an extra lambda frame per read.
 _SIMPLE_READERS = {
-    'IntProperty':    lambda s, sz: s.readInt32(),
-    'UInt32Property': lambda s, sz: s.readUInt32(),
-    'FloatProperty':  lambda s, sz: s.readFloat(),
-    'DoubleProperty': lambda s, sz: s.readDouble(),
-    'Int64Property':  lambda s, sz: s.readInt64(),
-    'UInt64Property': lambda s, sz: s.readUInt64(),
-    'Int16Property':  lambda s, sz: s.readInt16(),
-    'UInt16Property': lambda s, sz: s.readUInt16(),
+    'IntProperty':    'readInt32',
+    'UInt32Property': 'readUInt32',
+    'FloatProperty':  'readFloat',
+    'DoubleProperty': 'readDouble',
+    'Int64Property':  'readInt64',
+    'UInt64Property': 'readUInt64',
+    'Int16Property':  'readInt16',
+    'UInt16Property': 'readUInt16',
 }
 
 
 def _read_asa_property_value(stream, prop_type, index, size):
     """Read a single property value after its header has been consumed."""
 
-    if prop_type in _SIMPLE_READERS:
-        return _SIMPLE_READERS[prop_type](stream, size)
+    reader = _SIMPLE_READERS.get(prop_type)
+    if reader is not None:
+        return getattr(stream, reader)()
 
     if prop_type == 'BoolProperty':
         if size > 0:
@@ -160,9 +206,9 @@ def _read_asa_property_value(stream, prop_type, index, size):
 
     if prop_type == 'ByteProperty':
         if size == 1:
-            return _read_byte_val(stream)
+            return stream.readByte()
         if size > 0:
-            return stream.readBytes(size)
+            return bytes(stream.readBytes(size))
         return 0
 
     if prop_type == 'ObjectProperty':
@@ -174,20 +220,19 @@ def _read_asa_property_value(stream, prop_type, index, size):
             return None
         # 4-byte non-null: plain object index
         if len(raw) == 4:
-            import struct as _struct
-            return _struct.unpack_from('<i', raw, 0)[0]
+            return _STRUCT_I32.unpack_from(raw, 0)[0]
         # Longer: int32(flag) + NTString(blueprint path)
         if len(raw) >= 8:
-            import struct as _struct
-            flag = _struct.unpack_from('<i', raw, 0)[0]
-            slen = _struct.unpack_from('<i', raw, 4)[0]
+            flag = _STRUCT_I32.unpack_from(raw, 0)[0]
+            slen = _STRUCT_I32.unpack_from(raw, 4)[0]
             if flag >= 0 and 0 < slen < len(raw) and 8 + slen <= len(raw):
-                try:
-                    path = raw[8:8 + slen - 1].decode('utf-8')
-                    return path
-                except (UnicodeDecodeError, ValueError):
-                    pass
-        return raw
+                path = bytes(raw[8:8 + slen - 1])
+                # Blueprint paths are ASCII in practice; isascii() lets
+                # the common case decode without a try/except frame.
+                if path.isascii():
+                    return path.decode('ascii')
+                return path.decode('utf-8', errors='replace')
+        return bytes(raw)
 
     if prop_type == 'SoftObjectProperty':
         # UE5 FSoftObjectPath: PackagePath + AssetName + SubPathString
@@ -201,14 +246,85 @@ def _read_asa_property_value(stream, prop_type, index, size):
         }
 
     # Fallback: read raw bytes
-    raw = stream.readBytes(size)
-    return raw
+    return bytes(stream.readBytes(size))
 
 
 # ---------------------------------------------------------------------------
 # Recursive ASA struct/property parser
 # ---------------------------------------------------------------------------
 
+def _handle_array(stream, name, ptype, data_end):
+    """Parse an ArrayProperty body into an entry dict."""
+    child_type, s_name, package, idx, dsz, tag, length = \
+        _read_asa_array_header(stream)
+    data_start = stream.tell()
+    elements, has_sep = _read_asa_array_elements(
+        stream, child_type, s_name, dsz - 4, length, data_start)
+    return {
+        '_type': 'ArrayProperty',
+        '_child_type': child_type,
+        '_struct': s_name,
+        '_package': package,
+        '_index': idx,
+        '_size': dsz,
+        '_tag': tag,
+        '_has_sep': has_sep,
+        'length': length,
+        'value': elements,
+    }
+
+
+def _handle_map(stream, name, ptype, data_end):
+    return _read_asa_map_property(stream)
+
+
+def _handle_set(stream, name, ptype, data_end):
+    return _read_asa_set_property(stream)
+
+
+def _handle_bool(stream, name, ptype, data_end):
+    # BoolProperty stores its value in the flag byte position;
+    # the Size is always 0 and there is no separate value region.
+    idx = stream.readInt32()
+    _sz = stream.readInt32()      # always 0
+    bool_val = stream.readByte()  # preserve raw byte
+    return {
+        '_type': 'BoolProperty',
+        '_index': idx,
+        '_size': 0,
+        'value': bool_val,
+    }
+
+
+def _handle_simple(stream, name, ptype, data_end):
+    """Parse any simple (non-container) property into an entry dict."""
+    idx, sz, tag, extra = _read_asa_simple_header(stream)
+    value = _read_asa_property_value(stream, ptype, idx, sz)
+    return {
+        '_type': ptype,
+        '_index': idx,
+        '_size': sz,
+        '_tag': tag,
+        '_extra': extra,
+        'value': value,
+    }
+
+
+# One hashed lookup instead of an if/elif chain of string compares per
+# property; unknown types fall through to _handle_simple.
+_PTYPE_HANDLERS = {
+    'ArrayProperty': _handle_array,
+    'MapProperty': _handle_map,
+    'SetProperty': _handle_set,
+    'BoolProperty': _handle_bool,
+}
+
+
+# "No bound" sentinel for parse_asa_properties' end cursor; any real file
+# offset is far below it.
+_NO_END = 1 << 62
+
+
 def parse_asa_properties(stream, data_end=None):
     """
     Parse ASA-format properties from *stream* until a ``None`` terminator
@@ -216,129 +332,108 @@ def parse_asa_properties(stream, data_end=None):
 
     Returns an ``OrderedDict``-like plain dict of ``{name: value, ...}``
     where values are either primitives, dicts (structs), or lists (arrays).
+
+    Nested StructProperty levels are tracked on an explicit frame stack
+    rather than via recursion, so deeply nested dino/blueprint structs do
+    not consume a Python call frame per level.
     """
-    props = {}
+    root = {}
+    handler_get = _PTYPE_HANDLERS.get
+    stack = []          # enclosing-struct frames awaiting their inner dict
+    props = root
+    # Sentinel end-cursor: an unbounded parse gets a huge int instead of
+    # None, so the per-iteration bounds test is one integer compare.
+    if data_end is None:
+        data_end = _NO_END
     while True:
-        if data_end is not None and stream.tell() >= data_end:
-            break
-
-        pair_pos = stream.tell()
-        try:
-            name, ptype = _read_asa_pair(stream)
-        except Exception:
-            # Hit the edge of readable data – stop gracefully
-            if data_end is not None:
-                stream.base_stream.seek(data_end)
-            break
-        if name == 'None':
-            break
-
-        try:
-            if ptype == 'StructProperty':
-                struct_name, package, idx, dsz, tag = _read_asa_struct_header(stream)
-                data_start = stream.tell()
-                expected_end = data_start + dsz
-                inner = parse_asa_properties(stream, data_end=expected_end)
-
-                # If no properties were parsed, the struct likely stores
-                # raw data (e.g. Vector, Rotator, Quat).  Preserve the
-                # original bytes so the writer can replay them exactly.
-                raw_data = None
-                if not inner and dsz > 0:
-                    stream.base_stream.seek(data_start)
-                    raw_data = stream.readBytes(dsz)
-
-                # Safety: ensure stream lands at expected end
-                if stream.tell() != expected_end:
-                    stream.base_stream.seek(expected_end)
-                entry = {
-                    '_type': 'StructProperty',
-                    '_struct': struct_name,
-                    '_package': package,
-                    '_index': idx,
-                    '_size': dsz,
-                    '_tag': tag,
-                    'data': inner,
-                }
-                if raw_data is not None:
-                    entry['raw'] = raw_data
-                _merge_prop(props, name, entry)
-
-            elif ptype == 'ArrayProperty':
-                child_type, s_name, package, idx, dsz, tag, length = \
-                    _read_asa_array_header(stream)
-                data_start = stream.tell()
-                elements, has_sep = _read_asa_array_elements(
-                    stream, child_type, s_name, dsz - 4, length, data_start)
-                entry = {
-                    '_type': 'ArrayProperty',
-                    '_child_type': child_type,
-                    '_struct': s_name,
-                    '_package': package,
-                    '_index': idx,
-                    '_size': dsz,
-                    '_tag': tag,
-                    '_has_sep': has_sep,
-                    'length': length,
-                    'value': elements,
-                }
-                _merge_prop(props, name, entry)
-
-            elif ptype == 'MapProperty':
-                entry = _read_asa_map_property(stream)
-                _merge_prop(props, name, entry)
-
-            elif ptype == 'SetProperty':
-                entry = _read_asa_set_property(stream)
-                _merge_prop(props, name, entry)
-
-            elif ptype == 'BoolProperty':
-                # BoolProperty stores its value in the flag byte position;
-                # the Size is always 0 and there is no separate value region.
-                idx = stream.readInt32()
-                _sz = stream.readInt32()      # always 0
-                bool_val = _read_byte_val(stream)  # preserve raw byte
-                entry = {
-                    '_type': 'BoolProperty',
-                    '_index': idx,
-                    '_size': 0,
-                    'value': bool_val,
-                }
-                _merge_prop(props, name, entry)
-
+        finalize = False
+        if stream.tell() >= data_end:
+            finalize = True
+        else:
+            try:
+                name, ptype = _read_asa_pair(stream)
+            except Exception:
+                # Hit the edge of readable data – stop gracefully
+                if data_end != _NO_END:
+                    stream.base_stream.seek(data_end)
+                finalize = True
+            if finalize:
+                pass
+            elif name == 'None':
+                finalize = True
+            elif ptype == 'StructProperty':
+                try:
+                    (struct_name, package, idx, dsz,
+                     tag) = _read_asa_struct_header(stream)
+                except Exception:
+                    if data_end != _NO_END:
+                        stream.base_stream.seek(data_end)
+                    finalize = True
+                else:
+                    # Descend: push the current level and parse the
+                    # struct body into a fresh dict.
+                    data_start = stream.tell()
+                    entry = {
+                        '_type': 'StructProperty',
+                        '_struct': struct_name,
+                        '_package': package,
+                        '_index': idx,
+                        '_size': dsz,
+                        '_tag': tag,
+                        'data': {},
+                    }
+                    stack.append((props, data_end, name, entry, data_start))
+                    props = entry['data']
+                    data_end = data_start + dsz
             else:
-                idx, sz, tag, extra = _read_asa_simple_header(stream)
-                value = _read_asa_property_value(stream, ptype, idx, sz)
-                entry = {
-                    '_type': ptype,
-                    '_index': idx,
-                    '_size': sz,
-                    '_tag': tag,
-                    '_extra': extra,
-                    'value': value,
-                }
-                _merge_prop(props, name, entry)
-
-        except Exception:
-            # A property failed to parse.  Seek to data_end if known
-            # so the caller's stream position stays consistent.
-            if data_end is not None:
-                stream.base_stream.seek(data_end)
-            break
-
-    return props
+                try:
+                    entry = handler_get(ptype, _handle_simple)(
+                        stream, name, ptype, data_end)
+                    _merge_prop(props, name, entry)
+                except Exception:
+                    # A property failed to parse.  Seek to data_end if
+                    # known so the stream position stays consistent.
+                    if data_end != _NO_END:
+                        stream.base_stream.seek(data_end)
+                    finalize = True
+
+        if finalize:
+            if not stack:
+                return root
+            parent_props, parent_end, name, entry, data_start = stack.pop()
+            inner = props
+            dsz = entry['_size']
+            expected_end = data_start + dsz
+
+            # If no properties were parsed, the struct likely stores
+            # raw data (e.g. Vector, Rotator, Quat).  Preserve the
+            # original bytes so the writer can replay them exactly.
+            if not inner and dsz > 0:
+                stream.base_stream.seek(data_start)
+                entry['raw'] = bytes(stream.readBytes(dsz))
+
+            # Safety: ensure stream lands at expected end
+            if stream.tell() != expected_end:
+                stream.base_stream.seek(expected_end)
+            _merge_prop(parent_props, name, entry)
+            props, data_end = parent_props, parent_end
 
 
 def _merge_prop(props, name, entry):
     """Handle duplicate property names (indexed properties)."""
-    if name in props:
-        existing = props[name]
-        if isinstance(existing, list):
-            existing.append(entry)
-        else:
-            props[name] = [existing, entry]
+    existing = props.get(name)
+    if existing is None:
+        props[name] = entry           # common case: one hash insert
+    elif isinstance(existing, list):
+        existing.append(entry)
     else:
-        props[name] = entry
+        props[name] = [existing, entry]
+
+
+def _read_obj_elem(stream):
+    """Read one ObjectProperty array element (int32 prefix + NTString)."""
+    stream.readInt32()  # prefix (always 1)
+    return _safe_read_nt_string(stream)
 
 
 def _read_asa_array_elements(stream, child_type, struct_name,
@@ -360,63 +455,53 @@ def _read_asa_array_elements(stream, child_type, struct_name,
 
     if child_type == 'StructProperty':
         elements = []
-        has_separators = None          # detected from first transition
-        for i in range(length):
-            if i > 0:
-                # Peek at next 4 bytes: 0x00000000 means inter-element
-                # separator is present; any other value means the bytes
-                # are the NTString length of the next property name.
+        has_separators = False
+        try:
+            elements.append(parse_asa_properties(stream, data_end=data_end))
+            if length > 1:
+                # Peek at the first gap only: 0x00000000 means an
+                # inter-element separator is present; any other value is
+                # the NTString length of the next property name.  The
+                # layout is fixed for the whole array, so the remaining
+                # gaps need no peek-and-seek round trip.
                 peek_pos = stream.tell()
-                peek_val = stream.readInt32()
-                if has_separators is None:
-                    # First gap — decide once for the whole array
-                    has_separators = (peek_val == 0)
-                    if not has_separators:
-                        stream.base_stream.seek(peek_pos)
-                elif has_separators:
-                    pass                   # already consumed
-                else:
+                has_separators = (stream.readInt32() == 0)
+                if not has_separators:
                     stream.base_stream.seek(peek_pos)
-            try:
-                inner = parse_asa_properties(stream, data_end=data_end)
-                elements.append(inner)
-            except Exception:
-                # On failure, seek to the data boundary and stop
-                stream.base_stream.seek(data_end)
-                break
+                elements.append(parse_asa_properties(stream,
+                                                     data_end=data_end))
+                if has_separators:
+                    for _ in range(length - 2):
+                        stream.readInt32()     # separator
+                        elements.append(
+                            parse_asa_properties(stream, data_end=data_end))
+                else:
+                    for _ in range(length - 2):
+                        elements.append(
+                            parse_asa_properties(stream, data_end=data_end))
+        except Exception:
+            # On failure, seek to the data boundary and stop
+            stream.base_stream.seek(data_end)
         # Ensure we land at the correct position even if elements
         # consumed fewer or more bytes than expected.
         if stream.tell() != data_end:
             stream.base_stream.seek(data_end)
-        return (elements, bool(has_separators) if has_separators is not None
-                else False)
-
-    reader_map = {
-        'IntProperty':    lambda: stream.readInt32(),
-        'UInt32Property': lambda: stream.readUInt32(),
-        'FloatProperty':  lambda: stream.readFloat(),
-        'DoubleProperty': lambda: stream.readDouble(),
-        'Int64Property':  lambda: stream.readInt64(),
-        'UInt64Property': lambda: stream.readUInt64(),
-        'Int16Property':  lambda: stream.readInt16(),
-        'UInt16Property': lambda: stream.readUInt16(),
-        'ByteProperty':   lambda: stream.readUChar(),
-        'BoolProperty':   lambda: stream.readUChar(),
-    }
+        return (elements, has_separators)
 
-    if child_type in reader_map:
-        return ([reader_map[child_type]() for _ in range(length)], False)
+    if child_type in _BULK_FMT:
+        # Decode the whole array with one C-level unpack instead of a
+        # per-element Python read loop.
+        char, elem_size = _BULK_FMT[child_type]
+        blob = stream.readBytes(length * elem_size)
+        return (list(_bulk_struct(char, length).unpack(blob)), False)
 
     if child_type in ('StrProperty', 'NameProperty'):
-        return ([_safe_read_nt_string(stream)
-                for _ in range(length)], False)
+        # map + repeat keeps the whole loop in C; no per-iteration bytecode
+        return (list(map(_safe_read_nt_string, repeat(stream, length))),
+                False)
 
     if child_type == 'ObjectProperty':
-        elements = []
-        for _ in range(length):
-            stream.readInt32()  # prefix (always 1)
-            elements.append(_safe_read_nt_string(stream))
-        return (elements, False)
+        return (list(map(_read_obj_elem, repeat(stream, length))), False)
 
     if child_type == 'SoftObjectProperty':
         elements = []
@@ -441,10 +526,40 @@ def _read_asa_array_elements(stream, child_type, struct_name,
     # Fallback: read entire remaining data block as raw bytes
     remaining = data_end - stream.tell()
     if remaining > 0:
-        return (stream.readBytes(remaining), False)
+        return (bytes(stream.readBytes(remaining)), False)
     return ([], False)
 
 
+def struct_array_column(elements, field):
+    """Extract one field of a homogeneous StructProperty array as a column.
+
+    *elements* is the ``'value'`` list of a struct array (the array entry
+    dict itself is also accepted).  Elements missing *field* are skipped.
+    Numeric columns come back as a compact ``array.array`` ('q' for ints,
+    'd' for floats); anything else is returned as a plain list.
+
+    Bulk fix-ups (e.g. rescaling every item's quality) run much faster on
+    one contiguous column than on repeated per-element dict lookups.
+    """
+    if isinstance(elements, dict):
+        elements = elements.get('value', [])
+    values = [elem[field]['value'] for elem in elements if field in elem]
+    if not values:
+        return values
+    first = values[0]
+    if isinstance(first, bool):
+        return values
+    typecode = 'q' if isinstance(first, int) else (
+        'd' if isinstance(first, float) else None)
+    if typecode is None:
+        return values
+    try:
+        return array.array(typecode, values)
+    except (TypeError, OverflowError):
+        # Mixed-type column – hand back the plain list
+        return values
+
+
 def _read_asa_map_property(stream):
     """Read an ASA MapProperty."""
     _flag_k = stream.readInt32()
@@ -453,8 +568,8 @@ def _read_asa_map_property(stream):
     val_type = _safe_read_nt_string(stream)
     index = stream.readInt32()
     size = stream.readInt32()
-    tag = _read_byte_val(stream)         # property tag byte
-    raw = stream.readBytes(size)
+    tag = stream.readByte()         # property tag byte
+    raw = bytes(stream.readBytes(size))
     return {
         '_type': 'MapProperty',
         '_key_type': key_type,
@@ -472,7 +587,7 @@ def _read_asa_set_property(stream):
     elem_type = _safe_read_nt_string(stream)
     index = stream.readInt32()
     size = stream.readInt32()
-    tag = _read_byte_val(stream)         # property tag byte
+    tag = stream.readByte()         # property tag byte
 
     if elem_type == 'NameProperty':
         # Parse: 4-byte zero header, 4-byte count, then count NTStrings
@@ -491,7 +606,7 @@ def _read_asa_set_property(stream):
         except Exception:
             pass  # fall through to raw read
 
-    raw = stream.readBytes(size)
+    raw = bytes(stream.readBytes(size))
     return {
         '_type': 'SetProperty',
         '_elem_type': elem_type,
@@ -507,28 +622,44 @@ def _read_asa_set_property(stream):
 # ---------------------------------------------------------------------------
 
 
-def _write_nt_string(stream, s):
-    """Write a length-prefixed null-terminated string (inverse of _safe_read_nt_string)."""
+@lru_cache(maxsize=4096)
+def _encode_nt(s):
+    """Return the on-disk NTString bytes (length prefix + payload + null).
+
+    Cached: property/type/package names repeat thousands of times per
+    file, so each distinct string is encoded exactly once.
+    """
     if not s:
-        stream.writeUInt32(0)
-        return
+        return b'\x00\x00\x00\x00'
     encoded = s.encode('ascii')
-    stream.writeUInt32(len(encoded) + 1)
-    stream.writeBytes(encoded)
-    stream.writeUChar(0)
+    return _STRUCT_I32.pack(len(encoded) + 1) + encoded + b'\x00'
+
+
+def _write_nt_string(stream, s):
+    """Write a length-prefixed null-terminated string (inverse of _safe_read_nt_string)."""
+    stream.writeBytes(_encode_nt(s))
 
 
 def _nt_string_byte_size(s):
     """Return the number of bytes a NTString occupies on disk."""
-    if not s:
-        return 4  # just UInt32(0)
-    return 4 + len(s.encode('ascii')) + 1
+    return len(_encode_nt(s))
+
+
+def _encode_name_list(names):
+    """Serialise a SetProperty NameProperty payload in one pass.
+
+    Layout: int32 zero header, int32 count, then each name as an
+    NTString.  Assembled with a single join over the cached per-name
+    encodings instead of per-name stream writes.
+    """
+    parts = [_STRUCT_I32.pack(0), _STRUCT_I32.pack(len(names))]
+    parts.extend(map(_encode_nt, names))
+    return b''.join(parts)
 
 
 def _write_asa_pair(stream, name, ptype):
     """Write a (name, type) pair to an ASA property stream."""
-    _write_nt_string(stream, name)
-    _write_nt_string(stream, ptype)
+    stream.writeBytes(_encode_nt(name) + _encode_nt(ptype))
 
 
 # ---------------------------------------------------------------------------
@@ -601,54 +732,76 @@ def _write_asa_property_value(stream, prop_type, value, size):
         stream.writeBytes(bytes.fromhex(value))
 
 
-def _compute_value_size(prop_type, value, entry):
-    """Compute the byte size of a property value for the header."""
-    if prop_type in _SIMPLE_WRITERS:
-        return _SIMPLE_WRITERS[prop_type][1]
+def _size_string(value, entry):
+    if not value:
+        return entry.get('_size', 0)
+    return _nt_string_byte_size(value)
 
-    if prop_type == 'BoolProperty':
-        return 0
 
-    if prop_type in ('StrProperty', 'NameProperty'):
-        if not value:
-            return entry.get('_size', 0)
-        return _nt_string_byte_size(value)
-
-    if prop_type == 'ByteProperty':
-        if isinstance(value, int):
-            return 1
-        if isinstance(value, bytes):
-            return len(value)
-        if isinstance(value, str):
-            return len(bytes.fromhex(value))
+def _size_byte(value, entry):
+    if isinstance(value, int):
         return 1
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, str):
+        return len(bytes.fromhex(value))
+    return 1
 
-    if prop_type == 'ObjectProperty':
-        if value is None:
-            return entry.get('_size', 4)
-        if isinstance(value, int):
-            return 4
-        if isinstance(value, str):
-            encoded = value.encode('utf-8')
-            return 4 + 4 + len(encoded) + 1
+
+def _size_object(value, entry):
+    if value is None:
         return entry.get('_size', 4)
+    if isinstance(value, int):
+        return 4
+    if isinstance(value, str):
+        encoded = value.encode('utf-8')
+        return 4 + 4 + len(encoded) + 1
+    return entry.get('_size', 4)
 
-    if prop_type == 'SoftObjectProperty':
-        if isinstance(value, dict):
-            return (_nt_string_byte_size(value.get('package', ''))
-                    + _nt_string_byte_size(value.get('asset', ''))
-                    + _nt_string_byte_size(value.get('sub_path', '')))
-        return entry.get('_size', 12)
 
+def _size_soft_object(value, entry):
+    if isinstance(value, dict):
+        return (_nt_string_byte_size(value.get('package', ''))
+                + _nt_string_byte_size(value.get('asset', ''))
+                + _nt_string_byte_size(value.get('sub_path', '')))
+    return entry.get('_size', 12)
+
+
+def _size_fallback(value, entry):
     return entry.get('_size', 0)
 
 
+# Fixed-width scalar type -> on-disk byte size (no function call needed)
+_FIXED_SIZES = {t: sz for t, (_, sz) in _SIMPLE_WRITERS.items()}
+
+# Property type -> size function.  Fixed-width scalars share one closure
+# per width; the rest get a dedicated helper above.
+_SIZE_COMPUTERS = {
+    t: (lambda sz: lambda value, entry: sz)(sz)
+    for t, (_, sz) in _SIMPLE_WRITERS.items()
+}
+_SIZE_COMPUTERS.update({
+    'BoolProperty':       lambda value, entry: 0,
+    'StrProperty':        _size_string,
+    'NameProperty':       _size_string,
+    'ByteProperty':       _size_byte,
+    'ObjectProperty':     _size_object,
+    'SoftObjectProperty': _size_soft_object,
+})
+
+
+def _compute_value_size(prop_type, value, entry):
+    """Compute the byte size of a property value for the header."""
+    return _SIZE_COMPUTERS.get(prop_type, _size_fallback)(value, entry)
+
+
 # ---------------------------------------------------------------------------
 # Array element writer
 # ---------------------------------------------------------------------------
 
 
-def _write_asa_array_elements(stream, child_type, elements, has_sep=True):
+def _write_asa_array_elements(stream, child_type, elements, has_sep=True,
+                              inner_cache=None):
     """Write array elements to stream."""
     if not elements:
         return
@@ -657,41 +810,28 @@ def _write_asa_array_elements(stream, child_type, elements, has_sep=True):
         for i, elem in enumerate(elements):
             if i > 0 and has_sep:
                 stream.writeInt32(0)  # inter-element separator
-            serialize_asa_properties(stream, elem)
-        return
-
-    _array_writers = {
-        'IntProperty':    'writeInt32',
-        'UInt32Property': 'writeUInt32',
-        'FloatProperty':  'writeFloat',
-        'DoubleProperty': 'writeDouble',
-        'Int64Property':  'writeInt64',
-        'UInt64Property': 'writeUInt64',
-        'Int16Property':  'writeInt16',
-        'UInt16Property': 'writeUInt16',
-        'ByteProperty':   'writeUChar',
-    }
-
-    if child_type in _array_writers:
-        method_name = _array_writers[child_type]
-        for elem in elements:
-            getattr(stream, method_name)(elem)
+            serialize_asa_properties(stream, elem, inner_cache=inner_cache)
         return
 
-    if child_type == 'BoolProperty':
-        for elem in elements:
-            stream.writeUChar(elem if isinstance(elem, int) else (1 if elem else 0))
+    bulk = _BULK_FMT.get(child_type)
+    if bulk is not None:
+        if child_type == 'BoolProperty':
+            elements = [e if isinstance(e, int) else (1 if e else 0)
+                        for e in elements]
+        # Pack the whole array in one call instead of one write per element
+        stream.writeBytes(_bulk_struct(bulk[0], len(elements)).pack(*elements))
         return
 
     if child_type in ('StrProperty', 'NameProperty'):
-        for elem in elements:
-            _write_nt_string(stream, elem)
+        # Join the cached per-string encodings once — achievement and
+        # explorer-note lists run to thousands of short strings.
+        stream.writeBytes(b''.join(map(_encode_nt, elements)))
         return
 
     if child_type == 'ObjectProperty':
-        for elem in elements:
-            stream.writeInt32(1)  # prefix
-            _write_nt_string(stream, elem)
+        prefix = _STRUCT_I32.pack(1)
+        stream.writeBytes(b''.join(
+            prefix + _encode_nt(elem) for elem in elements))
         return
 
     if child_type == 'SoftObjectProperty':
@@ -711,10 +851,9 @@ def _write_asa_array_elements(stream, child_type, elements, has_sep=True):
 
 def _serialize_array_elements(child_type, elements, has_sep=True):
     """Serialize array elements to bytes buffer and return the bytes."""
-    buf = io.BytesIO()
-    stream = BinaryStream(buf)
+    stream = ByteArrayBinaryStream()
     _write_asa_array_elements(stream, child_type, elements, has_sep)
-    return buf.getvalue()
+    return bytes(stream.buf)
 
 
 # ---------------------------------------------------------------------------
@@ -725,187 +864,369 @@ def _serialize_array_elements(child_type, elements, has_sep=True):
 # Pre-computed NTString("None") bytes (used for size checks)
 _NONE_BYTES = b'\x05\x00\x00\x00None\x00'  # 9 bytes
 
+# Shared zero buffer for struct/array padding; memoryview slices of it
+# cost no allocation.  Pads beyond 64 KiB (unseen in practice) fall back
+# to a fresh buffer.
+_ZERO_POOL = b'\x00' * (1 << 16)
+
+
+def _zeros(n):
+    if n <= len(_ZERO_POOL):
+        return memoryview(_ZERO_POOL)[:n]
+    return b'\x00' * n
+
+
+# Pooled serialisation buffer for PlayerLocalData.save: it keeps its
+# grown capacity between saves and is overwritten in place, instead of
+# re-growing a fresh bytearray per save.  The lock hands concurrent
+# savers a private buffer rather than blocking them.
+_SAVE_BUF = bytearray()
+_SAVE_BUF_LOCK = threading.Lock()
+
 
 def _serialize_properties(props, with_none=True):
     """Serialize properties to bytes and return the buffer contents."""
-    buf = io.BytesIO()
-    stream = BinaryStream(buf)
+    stream = ByteArrayBinaryStream()
     serialize_asa_properties(stream, props, with_none=with_none)
-    return buf.getvalue()
+    return bytes(stream.buf)
+
 
+def serialize_asa_properties(stream, props, with_none=True, inner_cache=None):
+    """Write all properties to *stream*, optionally ending with ``None``.
 
-def serialize_asa_properties(stream, props, with_none=True):
-    """Write all properties to *stream*, optionally ending with ``None``."""
+    *inner_cache* maps id(entry) -> pre-serialised struct body, filled in
+    by a preceding recalculate_sizes pass so struct contents are not
+    serialised a second time here.
+    """
     for name, entry in props.items():
         if isinstance(entry, list):
             for e in entry:
-                _write_asa_property(stream, name, e)
+                _write_asa_property(stream, name, e, inner_cache)
         else:
-            _write_asa_property(stream, name, entry)
+            _write_asa_property(stream, name, entry, inner_cache)
     if with_none:
         _write_nt_string(stream, 'None')
 
 
-def _write_asa_property(stream, name, entry):
-    """Write a single property (header + value) to *stream*."""
-    ptype = entry.get('_type', '')
+def _write_struct_prop(stream, name, entry, inner_cache):
+    """Write a StructProperty header and body."""
+    entry_get = entry.get
+    _write_asa_pair(stream, name, 'StructProperty')
+    struct_name = entry_get('_struct', '')
+    package = entry_get('_package', '')
+    idx = entry_get('_index', 0)
+    data = entry_get('data', {})
+    orig_size = entry_get('_size', 0)
+    raw = entry_get('raw')
+
+    stream.writeInt32(1)               # flag1
+    _write_nt_string(stream, struct_name)
+    stream.writeInt32(1)               # flag2
+    _write_nt_string(stream, package)
+    stream.writeInt32(idx)
+
+    # Body already serialised by the recalc pass?  Emit it verbatim.
+    if inner_cache is not None:
+        cached = inner_cache.get(id(entry))
+        if cached is not None:
+            stream.writeInt32(len(cached))
+            stream.writeUChar(entry_get('_tag', 0))
+            stream.writeBytes(cached)
+            return
 
-    # -- StructProperty ------------------------------------------------
-    if ptype == 'StructProperty':
-        _write_asa_pair(stream, name, 'StructProperty')
-        struct_name = entry.get('_struct', '')
-        package = entry.get('_package', '')
-        idx = entry.get('_index', 0)
-        data = entry.get('data', {})
-        orig_size = entry.get('_size', 0)
-        raw = entry.get('raw')
-
-        # If the struct was stored as raw bytes (e.g. Vector, Rotator),
-        # replay those bytes directly.
-        if raw is not None and not data:
-            if isinstance(raw, str):
-                raw = bytes.fromhex(raw)
-            inner_bytes = raw
+    size_pos = stream.tell()
+    stream.writeInt32(0)               # data_size placeholder
+    stream.writeUChar(entry_get('_tag', 0))  # property tag byte
+    data_start = stream.tell()
+
+    # If the struct was stored as raw bytes (e.g. Vector, Rotator),
+    # replay those bytes directly.  Otherwise serialize the inner
+    # properties straight into the target stream (no temporary
+    # buffer) and patch data_size afterwards.
+    if raw is not None and not data:
+        stream.writeBytes(raw)
+    else:
+        serialize_asa_properties(stream, data, with_none=False,
+                                 inner_cache=inner_cache)
+        no_none_len = stream.tell() - data_start
+
+        if orig_size > 0 and no_none_len + len(_NONE_BYTES) > orig_size:
+            # Original struct data cannot fit properties + "None";
+            # the original used zero-padding instead of a terminator.
+            if orig_size > no_none_len:
+                stream.writeBytes(_zeros(orig_size - no_none_len))
         else:
-            # Serialize inner properties WITHOUT "None" first
-            no_none = _serialize_properties(data, with_none=False)
-
-            if orig_size > 0 and len(no_none) + len(_NONE_BYTES) > orig_size:
-                # Original struct data cannot fit properties + "None";
-                # the original used zero-padding instead of a terminator.
-                inner_bytes = no_none + b'\x00' * max(0, orig_size - len(no_none))
-            elif orig_size > 0:
+            stream.writeBytes(_NONE_BYTES)
+            if orig_size > 0:
                 # Use original size to preserve exact byte layout
-                with_terminator = no_none + _NONE_BYTES
-                if len(with_terminator) <= orig_size:
-                    inner_bytes = with_terminator + b'\x00' * (orig_size - len(with_terminator))
-                else:
-                    inner_bytes = with_terminator
-            else:
-                inner_bytes = no_none + _NONE_BYTES
-
-        stream.writeInt32(1)               # flag1
-        _write_nt_string(stream, struct_name)
-        stream.writeInt32(1)               # flag2
-        _write_nt_string(stream, package)
-        stream.writeInt32(idx)
-        stream.writeInt32(len(inner_bytes))  # data_size
-        stream.writeUChar(entry.get('_tag', 0))  # property tag byte
-        stream.writeBytes(inner_bytes)
-        return
+                pad = orig_size - (no_none_len + len(_NONE_BYTES))
+                if pad > 0:
+                    stream.writeBytes(_zeros(pad))
+
+    end = stream.tell()
+    stream.base_stream.seek(size_pos)
+    stream.writeInt32(end - data_start)  # actual data_size
+    stream.base_stream.seek(end)
+
+
+def _write_array_prop(stream, name, entry, inner_cache):
+    """Write an ArrayProperty header and elements."""
+    entry_get = entry.get
+    _write_asa_pair(stream, name, 'ArrayProperty')
+    child_type = entry_get('_child_type', '')
+    s_name = entry_get('_struct')
+    package = entry_get('_package')
+    idx = entry_get('_index', 0)
+    elements = entry_get('value', [])
+    length = len(elements) if isinstance(elements, list) else 0
+    stream.writeInt32(1)               # flag
+    _write_nt_string(stream, child_type)
+    if child_type == 'StructProperty':
+        stream.writeInt32(1)           # flag2
+        _write_nt_string(stream, s_name or '')
+        stream.writeInt32(1)           # flag3
+        _write_nt_string(stream, package or '')
+    stream.writeInt32(idx)
+    size_pos = stream.tell()
+    stream.writeInt32(0)               # data_size placeholder
+    stream.writeUChar(entry_get('_tag', 0))
+    data_start = stream.tell()
+    stream.writeInt32(length)
+    _write_asa_array_elements(
+        stream, child_type, elements, entry_get('_has_sep', True),
+        inner_cache)
+    computed_ds = stream.tell() - data_start
+    orig_ds = entry_get('_size', 0)
+    # Use the larger of original and computed to prevent truncation.
+    # When content is unmodified, computed_ds <= orig_ds (trailing
+    # padding is preserved).  When content grew, computed_ds wins.
+    data_size = max(orig_ds, computed_ds) if orig_ds > 0 else computed_ds
+    if data_size > computed_ds:
+        stream.writeBytes(_zeros(data_size - computed_ds))
+    end = stream.tell()
+    stream.base_stream.seek(size_pos)
+    stream.writeInt32(data_size)
+    stream.base_stream.seek(end)
+
+
+def _write_bool_prop(stream, name, entry, inner_cache):
+    """Write a BoolProperty (value lives in the flag byte)."""
+    _write_asa_pair(stream, name, 'BoolProperty')
+    stream.writeInt32(entry.get('_index', 0))
+    stream.writeInt32(0)               # size always 0
+    val = entry.get('value', 0)
+    stream.writeUChar(val if isinstance(val, int) else (1 if val else 0))
+
+
+def _write_map_prop(stream, name, entry, inner_cache):
+    """Write a MapProperty (raw payload replay)."""
+    entry_get = entry.get
+    _write_asa_pair(stream, name, 'MapProperty')
+    raw = entry_get('raw', b'')
+    stream.writeInt32(1)               # flag_k
+    _write_nt_string(stream, entry_get('_key_type', ''))
+    stream.writeInt32(1)               # flag_v
+    _write_nt_string(stream, entry_get('_val_type', ''))
+    stream.writeInt32(entry_get('_index', 0))
+    stream.writeInt32(len(raw))
+    stream.writeUChar(entry_get('_tag', 0))  # property tag
+    stream.writeBytes(raw)
+
+
+def _write_set_prop(stream, name, entry, inner_cache):
+    """Write a SetProperty (decoded name list or raw payload)."""
+    entry_get = entry.get
+    _write_asa_pair(stream, name, 'SetProperty')
+    elem_type = entry_get('_elem_type', '')
+    if elem_type == 'NameProperty' and 'value' in entry:
+        payload = _encode_name_list(entry['value'])
+    else:
+        payload = entry_get('raw', b'')
+    stream.writeInt32(1)               # flag
+    _write_nt_string(stream, elem_type)
+    stream.writeInt32(entry_get('_index', 0))
+    stream.writeInt32(len(payload))
+    stream.writeUChar(entry_get('_tag', 0))  # property tag
+    stream.writeBytes(payload)
+
+
+# Container property types -> specialised writer; anything else is a
+# simple property and goes through _emit_simple.
+_PROP_WRITERS = {
+    'StructProperty': _write_struct_prop,
+    'ArrayProperty': _write_array_prop,
+    'BoolProperty': _write_bool_prop,
+    'MapProperty': _write_map_prop,
+    'SetProperty': _write_set_prop,
+}
 
-    # -- ArrayProperty -------------------------------------------------
-    if ptype == 'ArrayProperty':
-        _write_asa_pair(stream, name, 'ArrayProperty')
-        child_type = entry.get('_child_type', '')
-        s_name = entry.get('_struct')
-        package = entry.get('_package')
-        idx = entry.get('_index', 0)
-        elements = entry.get('value', [])
-        actual_length = len(elements) if isinstance(elements, list) else 0
-        length = actual_length
-        elem_bytes = _serialize_array_elements(
-            child_type, elements, entry.get('_has_sep', True))
-        computed_ds = 4 + len(elem_bytes)    # 4 for length int32
-        orig_ds = entry.get('_size', 0)
-        # Use the larger of original and computed to prevent truncation.
-        # When content is unmodified, computed_ds <= orig_ds (trailing
-        # padding is preserved).  When content grew, computed_ds wins.
-        data_size = max(orig_ds, computed_ds) if orig_ds > 0 else computed_ds
-        stream.writeInt32(1)               # flag
-        _write_nt_string(stream, child_type)
-        if child_type == 'StructProperty':
-            stream.writeInt32(1)           # flag2
-            _write_nt_string(stream, s_name or '')
-            stream.writeInt32(1)           # flag3
-            _write_nt_string(stream, package or '')
-        stream.writeInt32(idx)
-        stream.writeInt32(data_size)
-        stream.writeUChar(entry.get('_tag', 0))
-        stream.writeInt32(length)
-        stream.writeBytes(elem_bytes)
-        pad = (data_size - 4) - len(elem_bytes)
-        if pad > 0:
-            stream.writeBytes(b'\x00' * pad)
-        return
 
-    # -- BoolProperty --------------------------------------------------
-    if ptype == 'BoolProperty':
-        _write_asa_pair(stream, name, 'BoolProperty')
-        idx = entry.get('_index', 0)
-        stream.writeInt32(idx)
-        stream.writeInt32(0)               # size always 0
-        val = entry.get('value', 0)
-        stream.writeUChar(val if isinstance(val, int) else (1 if val else 0))
-        return
+def _write_asa_property(stream, name, entry, inner_cache=None):
+    """Write a single property (header + value) to *stream*."""
+    ptype = entry.get('_type', '')
+    writer = _PROP_WRITERS.get(ptype)
+    if writer is not None:
+        writer(stream, name, entry, inner_cache)
+    else:
+        _emit_simple(stream, name, ptype, entry)
 
-    # -- MapProperty ---------------------------------------------------
-    if ptype == 'MapProperty':
-        _write_asa_pair(stream, name, 'MapProperty')
-        key_type = entry.get('_key_type', '')
-        val_type = entry.get('_val_type', '')
-        idx = entry.get('_index', 0)
-        raw = entry.get('raw', b'')
-        if isinstance(raw, str):
-            raw = bytes.fromhex(raw)
-        stream.writeInt32(1)               # flag_k
-        _write_nt_string(stream, key_type)
-        stream.writeInt32(1)               # flag_v
-        _write_nt_string(stream, val_type)
-        stream.writeInt32(idx)
-        stream.writeInt32(len(raw))
-        stream.writeUChar(entry.get('_tag', 0))  # property tag
-        stream.writeBytes(raw)
-        return
 
-    # -- SetProperty ---------------------------------------------------
-    if ptype == 'SetProperty':
-        _write_asa_pair(stream, name, 'SetProperty')
-        elem_type = entry.get('_elem_type', '')
-        idx = entry.get('_index', 0)
-        stag = entry.get('_tag', 0)
-        if elem_type == 'NameProperty' and 'value' in entry:
-            buf = io.BytesIO()
-            bs = BinaryStream(buf)
-            bs.writeInt32(0)  # zero header
-            names = entry['value']
-            bs.writeInt32(len(names))
-            for n in names:
-                _write_nt_string(bs, n)
-            set_data = buf.getvalue()
-            stream.writeInt32(1)           # flag
-            _write_nt_string(stream, elem_type)
-            stream.writeInt32(idx)
-            stream.writeInt32(len(set_data))
-            stream.writeUChar(stag)        # property tag
-            stream.writeBytes(set_data)
-        else:
-            raw = entry.get('raw', b'')
-            if isinstance(raw, str):
-                raw = bytes.fromhex(raw)
-            stream.writeInt32(1)           # flag
-            _write_nt_string(stream, elem_type)
-            stream.writeInt32(idx)
-            stream.writeInt32(len(raw))
-            stream.writeUChar(stag)        # property tag
-            stream.writeBytes(raw)
-        return
+def _emit_simple(stream, name, ptype, entry):
+    """Write a simple (non-container) property with one header write.
 
-    # -- Simple properties (Int, Float, Str, Name, Object, etc.) -------
-    _write_asa_pair(stream, name, ptype)
-    idx = entry.get('_index', 0)
-    value = entry.get('value')
+    The name/type strings, index, size, tag (and optional extra index)
+    are joined into a single writeBytes instead of six separate stream
+    calls; only the value itself goes through the per-type writer.
+    """
+    entry_get = entry.get
+    value = entry_get('value')
     sz = _compute_value_size(ptype, value, entry)
-    tag = entry.get('_tag', 0)
-    stream.writeInt32(idx)
-    stream.writeInt32(sz)
-    stream.writeUChar(tag)
+    tag = entry_get('_tag', 0)
+    parts = [_encode_nt(name), _encode_nt(ptype),
+             _STRUCT_I32.pack(entry_get('_index', 0)),
+             _STRUCT_I32.pack(sz),
+             bytes((tag,))]
     if tag:
-        extra = entry.get('_extra')
-        stream.writeInt32(extra if extra is not None else 0)
+        extra = entry_get('_extra')
+        parts.append(_STRUCT_I32.pack(extra if extra is not None else 0))
+    stream.writeBytes(b''.join(parts))
     _write_asa_property_value(stream, ptype, value, sz)
 
 
+# ---------------------------------------------------------------------------
+# JSON-safe tree conversion
+# ---------------------------------------------------------------------------
+
+def _j_float(obj):
+    if math.isnan(obj) or math.isinf(obj):
+        return {'__special_float__': _F64.pack(obj).hex()}
+    return obj
+
+
+def _j_ident(obj):
+    return obj
+
+
+# Exact-type dispatch for leaf nodes: one hashed lookup per node instead
+# of an isinstance cascade.  Unknown types stringify, as before.
+_JSONIFY = {
+    bytes: bytes.hex,
+    float: _j_float,
+    int: _j_ident,
+    bool: _j_ident,
+    str: _j_ident,
+    type(None): _j_ident,
+}
+
+
+def _json_safe(obj):
+    """Convert a parsed tree to JSON-safe types, iteratively.
+
+    Containers are walked with an explicit stack (profile trees nest
+    six-plus levels deep) and leaves go through the _JSONIFY dispatch.
+    """
+    t = type(obj)
+    if t is dict:
+        root = {}
+    elif t is list:
+        root = []
+    else:
+        return _JSONIFY.get(t, str)(obj)
+    leaf = _JSONIFY.get
+    stack = [(obj, root)]
+    while stack:
+        src, dst = stack.pop()
+        if type(src) is dict:
+            for k, v in src.items():
+                tv = type(v)
+                if tv is dict:
+                    child = dst[k] = {}
+                    stack.append((v, child))
+                elif tv is list:
+                    child = dst[k] = []
+                    stack.append((v, child))
+                else:
+                    dst[k] = leaf(tv, str)(v)
+        else:
+            append = dst.append
+            for v in src:
+                tv = type(v)
+                if tv is dict:
+                    child = {}
+                    append(child)
+                    stack.append((v, child))
+                elif tv is list:
+                    child = []
+                    append(child)
+                    stack.append((v, child))
+                else:
+                    append(leaf(tv, str)(v))
+    return root
+
+
+def _special_float(obj):
+    return _F64.unpack(bytes.fromhex(obj['__special_float__']))[0]
+
+
+def _unjson_safe(obj):
+    """Reverse _json_safe, iteratively.
+
+    Hex strings under 'raw' keys become bytes again (the sole
+    normalisation point for raw blobs — the write and recalc paths never
+    re-test or re-decode hex) and __special_float__ markers turn back
+    into NaN/inf floats.
+    """
+    t = type(obj)
+    if t is dict:
+        if '__special_float__' in obj:
+            return _special_float(obj)
+        root = {}
+    elif t is list:
+        root = []
+    else:
+        return obj
+    stack = [(obj, root)]
+    while stack:
+        src, dst = stack.pop()
+        if type(src) is dict:
+            for k, v in src.items():
+                tv = type(v)
+                if tv is dict:
+                    if '__special_float__' in v:
+                        dst[k] = _special_float(v)
+                    else:
+                        child = dst[k] = {}
+                        stack.append((v, child))
+                elif tv is list:
+                    child = dst[k] = []
+                    stack.append((v, child))
+                elif tv is str and k == 'raw':
+                    try:
+                        dst[k] = bytes.fromhex(v)
+                    except ValueError:
+                        dst[k] = v
+                else:
+                    dst[k] = v
+        else:
+            append = dst.append
+            for v in src:
+                tv = type(v)
+                if tv is dict:
+                    if '__special_float__' in v:
+                        append(_special_float(v))
+                    else:
+                        child = {}
+                        append(child)
+                        stack.append((v, child))
+                elif tv is list:
+                    child = []
+                    append(child)
+                    stack.append((v, child))
+                else:
+                    append(v)
+    return root
+
+
 # ---------------------------------------------------------------------------
 # PlayerLocalData reader
 # ---------------------------------------------------------------------------
@@ -952,6 +1273,11 @@ class PlayerLocalData:
         # Raw trailing bytes that follow the property section
         self.trailing_data = b''
 
+        # Set by edits (see mark_dirty); freshly parsed trees are clean
+        self._dirty = True
+        # id(entry) -> serialised struct body from the last recalc pass
+        self._inner_cache = None
+
         if file_path is not None:
             self._load(file_path)
 
@@ -1073,42 +1399,59 @@ class PlayerLocalData:
 
     def _load(self, file_path):
         with open(file_path, 'rb') as ifile:
-            stream = BinaryStream(ifile)
-
-            # --- ASA extended header ---
-            self.header_v1 = stream.readInt32()
-            self.header_v2 = stream.readInt32()
-            self.header_v3 = stream.readInt32()
-            self.version = stream.readInt32()
-
-            if self.version != 1:
-                raise ASAParseError(
-                    'Unexpected version %d (expected 1)' % self.version)
-
-            self.guid = stream.readBytes(16)
-            self.file_type = _safe_read_nt_string(stream)
-            stream.readInt32()  # always 0
-            stream.readInt32()  # always 5
-            self.name = _safe_read_nt_string(stream)
-            self.controller = _safe_read_nt_string(stream)
-            self.game_mode = _safe_read_nt_string(stream)
-            self.map_name = _safe_read_nt_string(stream)
-            self.map_path = _safe_read_nt_string(stream)
-            stream.readBytes(12)  # 12 zero bytes
-            self.header_size = stream.readInt32()
-            stream.readInt32()    # always 0
-            stream.readByte()     # ASA extra separator byte (0x00)
-
-            # --- Properties section ---
-            self.data = parse_asa_properties(stream)
-
-            # --- Trailing data (raw) ---
-            pos = stream.tell()
-            ifile.seek(0, 2)
-            end = ifile.tell()
-            if pos < end:
-                ifile.seek(pos)
-                self.trailing_data = ifile.read()
+            # Memory-map the file and parse through a zero-copy view, so
+            # readBytes returns slices instead of allocating per read.
+            try:
+                mm = mmap.mmap(ifile.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # mmap can fail on empty files and exotic filesystems;
+                # fall back to one plain read into memory.
+                data = ifile.read()
+                self._parse(BufferBinaryStream(data), len(data))
+                return
+            stream = BufferBinaryStream(mm)
+            try:
+                self._parse(stream, len(mm))
+            finally:
+                stream.buf.release()
+                mm.close()
+
+    def _parse(self, stream, file_size):
+
+        # --- ASA extended header ---
+        self.header_v1 = stream.readInt32()
+        self.header_v2 = stream.readInt32()
+        self.header_v3 = stream.readInt32()
+        self.version = stream.readInt32()
+
+        if self.version != 1:
+            raise ASAParseError(
+                'Unexpected version %d (expected 1)' % self.version)
+
+        self.guid = bytes(stream.readBytes(16))
+        self.file_type = _safe_read_nt_string(stream)
+        stream.readInt32()  # always 0
+        stream.readInt32()  # always 5
+        self.name = _safe_read_nt_string(stream)
+        self.controller = _safe_read_nt_string(stream)
+        self.game_mode = _safe_read_nt_string(stream)
+        self.map_name = _safe_read_nt_string(stream)
+        self.map_path = _safe_read_nt_string(stream)
+        stream.readBytes(12)  # 12 zero bytes
+        self.header_size = stream.readInt32()
+        stream.readInt32()    # always 0
+        stream.readByte()     # ASA extra separator byte (0x00)
+
+        # --- Properties section ---
+        self.data = parse_asa_properties(stream)
+
+        # --- Trailing data (raw) ---
+        pos = stream.tell()
+        if pos < file_size:
+            self.trailing_data = bytes(stream.readBytes(file_size - pos))
+
+        # Sizes in a freshly parsed tree match the file by construction
+        self._dirty = False
 
     def __repr__(self):
         return '<PlayerLocalData %s map=%s items=%d dinos=%d>' % (
@@ -1125,28 +1468,17 @@ class PlayerLocalData:
         """Get a top-level property by name."""
         return self.data.get(key, default)
 
+    def mark_dirty(self):
+        """Flag the tree as edited so the next :meth:`save` recalculates
+        sizes.  Call after mutating :attr:`data` in place."""
+        self._dirty = True
+
     # -- serialisation helpers ----------------------------------------------
 
     @staticmethod
     def _jsonify(obj):
-        """Recursively convert parsed data tree to JSON-safe types."""
-        if isinstance(obj, dict):
-            return {k: PlayerLocalData._jsonify(v) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [PlayerLocalData._jsonify(v) for v in obj]
-        if isinstance(obj, bytes):
-            # Try to present bytes as hex string
-            return obj.hex()
-        if isinstance(obj, float):
-            import math, struct as _st
-            if math.isnan(obj) or math.isinf(obj):
-                return {'__special_float__': _st.pack('<d', obj).hex()}
-            return obj
-        if isinstance(obj, (int, str, bool)):
-            return obj
-        if obj is None:
-            return None
-        return str(obj)
+        """Convert a parsed data tree to JSON-safe types."""
+        return _json_safe(obj)
 
     def to_dict(self):
         """Return the full parsed data as a JSON-serialisable dict."""
@@ -1171,9 +1503,17 @@ class PlayerLocalData:
 
     def to_json(self, indent=2):
         """Return the full parsed data as a JSON string."""
-        import json
         return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
 
+    def write_json(self, fp, indent=2):
+        """Stream the full parsed data as JSON to a writable text file.
+
+        Unlike ``to_json``, the serialised text is never materialised as
+        one big string, so peak memory stays near the size of the parsed
+        tree for multi-megabyte profiles.
+        """
+        json.dump(self.to_dict(), fp, indent=indent, ensure_ascii=False)
+
     # -- binary writer --------------------------------------------------
 
     def save(self, file_path):
@@ -1181,37 +1521,93 @@ class PlayerLocalData:
 
         Sizes and lengths are recalculated from actual content before
         writing, so manual ``_size`` / ``length`` bookkeeping is not
-        required after editing.
+        required after editing.  The walk is skipped for trees that are
+        still clean from parsing (a plain load/save round trip); after
+        in-place edits of :attr:`data`, call :meth:`mark_dirty` (or
+        :meth:`recalculate_sizes` directly).
         """
-        self.recalculate_sizes()
-        with open(file_path, 'wb') as ofile:
-            stream = BinaryStream(ofile)
-
-            # --- ASA extended header ---
-            stream.writeInt32(self.header_v1)
-            stream.writeInt32(self.header_v2)
-            stream.writeInt32(self.header_v3)
-            stream.writeInt32(self.version)
-            stream.writeBytes(self.guid)
-            _write_nt_string(stream, self.file_type)
-            stream.writeInt32(0)
-            stream.writeInt32(5)
-            _write_nt_string(stream, self.name)
-            _write_nt_string(stream, self.controller)
-            _write_nt_string(stream, self.game_mode)
-            _write_nt_string(stream, self.map_name)
-            _write_nt_string(stream, self.map_path)
-            stream.writeBytes(b'\x00' * 12)
-            stream.writeInt32(self.header_size)
-            stream.writeInt32(0)
-            stream.writeUChar(0)   # ASA extra separator byte
+        if self._dirty:
+            self.recalculate_sizes()
+        # Serialise into one in-memory buffer and flush with a single
+        # write, instead of thousands of tiny file.write calls.  The
+        # pooled buffer is overwritten in place from position 0, so
+        # repeated saves (GUI rebuilds) stop re-growing a fresh bytearray
+        # each time; concurrent saves fall back to a private buffer.
+        pooled = _SAVE_BUF_LOCK.acquire(blocking=False)
+        try:
+            stream = ByteArrayBinaryStream(_SAVE_BUF if pooled
+                                           else bytearray())
+            stream.seek(0)
+            stream.writeBytes(self._header_bytes())
 
             # --- Properties section ---
-            serialize_asa_properties(stream, self.data)
+            serialize_asa_properties(stream, self.data,
+                                     inner_cache=self._inner_cache)
+            self._inner_cache = None   # one-shot; edits invalidate it
 
             # --- Trailing data ---
             stream.writeBytes(self.trailing_data)
 
+            with open(file_path, 'wb') as ofile:
+                ofile.write(memoryview(stream.buf)[:stream.pos])
+        finally:
+            if pooled:
+                _SAVE_BUF_LOCK.release()
+
+    def save_iter(self, file_path, chunk_bytes=1 << 20):
+        """Write the profile like :meth:`save`, but flush the buffer to
+        disk roughly every *chunk_bytes* bytes.
+
+        Peak memory stays bounded by the chunk size plus the largest
+        single top-level property, instead of the whole file — useful
+        when batch-processing many large profiles.  Flushing happens
+        only between top-level properties, so the in-property
+        data_size back-patching still works on the live buffer.
+        """
+        if self._dirty:
+            self.recalculate_sizes()
+        inner_cache = self._inner_cache
+        with open(file_path, 'wb') as ofile:
+            stream = ByteArrayBinaryStream()
+            stream.writeBytes(self._header_bytes())
+            for name, entry in self.data.items():
+                if isinstance(entry, list):
+                    for e in entry:
+                        _write_asa_property(stream, name, e, inner_cache)
+                else:
+                    _write_asa_property(stream, name, entry, inner_cache)
+                if len(stream.buf) >= chunk_bytes:
+                    ofile.write(stream.buf)
+                    stream.buf.clear()
+                    stream.pos = 0
+            _write_nt_string(stream, 'None')
+            stream.writeBytes(self.trailing_data)
+            ofile.write(stream.buf)
+        self._inner_cache = None
+
+    def _header_bytes(self):
+        """Assemble the fixed ASA extended header as one blob."""
+        pack_i32 = _STRUCT_I32.pack
+        return b''.join((
+            pack_i32(self.header_v1),
+            pack_i32(self.header_v2),
+            pack_i32(self.header_v3),
+            pack_i32(self.version),
+            self.guid,
+            _encode_nt(self.file_type),
+            pack_i32(0),
+            pack_i32(5),
+            _encode_nt(self.name),
+            _encode_nt(self.controller),
+            _encode_nt(self.game_mode),
+            _encode_nt(self.map_name),
+            _encode_nt(self.map_path),
+            b'\x00' * 12,
+            pack_i32(self.header_size),
+            pack_i32(0),
+            b'\x00',          # ASA extra separator byte
+        ))
+
     # -- reconstruction from dict / JSON --------------------------------
 
     def recalculate_sizes(self):
@@ -1221,34 +1617,43 @@ class PlayerLocalData:
         Called automatically by :meth:`save`, but can be invoked manually
         after programmatic edits to keep the dict representation consistent.
         """
-        self.data = self._recalc(self.data)
+        # Fresh memo per pass: profiles are full of template items whose
+        # leaf values are shared/interned objects, so identical leaves
+        # are sized once.
+        self._inner_cache = {}
+        self.data = self._recalc(self.data, {}, self._inner_cache)
+        self._dirty = False
 
     @classmethod
-    def _recalc(cls, props):
+    def _recalc(cls, props, cache=None, inner_cache=None):
         """Recursively recalculate sizes for a property dict."""
+        if cache is None:
+            cache = {}
         for name, entry in list(props.items()):
             if isinstance(entry, list):
-                props[name] = [cls._recalc_entry(e) for e in entry]
+                props[name] = [cls._recalc_entry(e, cache, inner_cache)
+                               for e in entry]
             elif isinstance(entry, dict) and '_type' in entry:
-                props[name] = cls._recalc_entry(entry)
+                props[name] = cls._recalc_entry(entry, cache, inner_cache)
         return props
 
     @classmethod
-    def _recalc_entry(cls, entry):
-        ptype = entry.get('_type', '')
+    def _recalc_entry(cls, entry, cache=None, inner_cache=None):
+        entry_get = entry.get
+        ptype = entry_get('_type', '')
+        if cache is None:
+            cache = {}
 
         if ptype == 'StructProperty':
-            data = entry.get('data', {})
+            data = entry_get('data', {})
             if data:
-                cls._recalc(data)
-                raw = entry.get('raw')
+                cls._recalc(data, cache, inner_cache)
+                raw = entry_get('raw')
                 if raw is not None and not data:
-                    if isinstance(raw, str):
-                        raw = bytes.fromhex(raw)
                     inner_bytes = raw
                 else:
                     no_none = _serialize_properties(data, with_none=False)
-                    orig = entry.get('_size', 0)
+                    orig = entry_get('_size', 0)
                     if orig > 0 and len(no_none) + len(_NONE_BYTES) > orig:
                         inner_bytes = no_none + b'\x00' * max(0, orig - len(no_none))
                     elif orig > 0:
@@ -1257,44 +1662,68 @@ class PlayerLocalData:
                     else:
                         inner_bytes = no_none + _NONE_BYTES
                 entry['_size'] = len(inner_bytes)
+                if inner_cache is not None:
+                    # Let save() replay this body instead of
+                    # re-serialising the struct contents.
+                    inner_cache[id(entry)] = inner_bytes
 
         elif ptype == 'ArrayProperty':
-            elements = entry.get('value', [])
+            elements = entry_get('value', [])
             actual_len = len(elements) if isinstance(elements, list) else 0
             entry['length'] = actual_len
-            child_type = entry.get('_child_type', '')
+            child_type = entry_get('_child_type', '')
             if child_type == 'StructProperty' and isinstance(elements, list):
                 for elem in elements:
                     if isinstance(elem, dict):
-                        cls._recalc(elem)
-            elem_bytes = _serialize_array_elements(
-                child_type, elements, entry.get('_has_sep', True))
-            computed = 4 + len(elem_bytes)
-            orig = entry.get('_size', 0)
+                        cls._recalc(elem, cache, inner_cache)
+            bulk = _BULK_FMT.get(child_type)
+            if bulk is not None and isinstance(elements, list):
+                # Fixed-width elements: size arithmetically, no packing
+                computed = 4 + len(elements) * bulk[1]
+            elif (child_type in ('StrProperty', 'NameProperty')
+                    and isinstance(elements, list)):
+                computed = 4 + sum(map(len, map(_encode_nt, elements)))
+            else:
+                elem_bytes = _serialize_array_elements(
+                    child_type, elements, entry_get('_has_sep', True))
+                computed = 4 + len(elem_bytes)
+            orig = entry_get('_size', 0)
             entry['_size'] = max(orig, computed) if orig > 0 else computed
 
         elif ptype == 'MapProperty':
-            raw = entry.get('raw', b'')
-            if isinstance(raw, str):
-                raw = bytes.fromhex(raw)
-            entry['_size'] = len(raw)
+            entry['_size'] = len(entry_get('raw', b''))
 
         elif ptype == 'SetProperty':
-            elem_type = entry.get('_elem_type', '')
+            elem_type = entry_get('_elem_type', '')
             if elem_type == 'NameProperty' and 'value' in entry:
-                buf = io.BytesIO()
-                bs = BinaryStream(buf)
-                bs.writeInt32(0)
                 names = entry['value']
-                bs.writeInt32(len(names))
-                for n in names:
-                    _write_nt_string(bs, n)
-                entry['_size'] = buf.tell()
+                key = ('SetProperty', id(names))
+                sz = cache.get(key)
+                if sz is None:
+                    sz = cache[key] = len(_encode_name_list(names))
+                entry['_size'] = sz
             # else: raw — _size already matches len(raw)
 
         elif ptype != 'BoolProperty':
-            value = entry.get('value')
-            entry['_size'] = _compute_value_size(ptype, value, entry)
+            # Fixed-width scalars dominate large trees; assign their
+            # constant width directly instead of calling into the
+            # sizing dispatch.
+            sz = _FIXED_SIZES.get(ptype)
+            if sz is not None:
+                entry['_size'] = sz
+                return entry
+            value = entry_get('value')
+            if value:
+                # Memoise by value identity.  Only truthy values: the
+                # empty/None fallbacks read the entry's own _size, so
+                # they must not be shared between entries.
+                key = (ptype, id(value))
+                sz = cache.get(key)
+                if sz is None:
+                    sz = cache[key] = _compute_value_size(ptype, value, entry)
+                entry['_size'] = sz
+            else:
+                entry['_size'] = _compute_value_size(ptype, value, entry)
 
         return entry
 
@@ -1319,33 +1748,26 @@ class PlayerLocalData:
         if td:
             obj.trailing_data = bytes.fromhex(td)
         else:
-            obj.trailing_data = struct.pack('<I', 0) + obj.guid
+            obj.trailing_data = _STRUCT_I32.pack(0) + obj.guid
         obj.data = cls._unjsonify(d.get('data', {}))
         return obj
 
     @classmethod
     def from_json(cls, json_str):
         """Create a ``PlayerLocalData`` from a JSON string."""
-        import json
         return cls.from_dict(json.loads(json_str))
 
+    @classmethod
+    def from_json_file(cls, fp):
+        """Create a ``PlayerLocalData`` from an open JSON text file.
+
+        Counterpart of :meth:`write_json`: parses straight from the
+        stream with ``json.load``, skipping the intermediate full-file
+        string ``from_json`` needs.
+        """
+        return cls.from_dict(json.load(fp))
+
     @staticmethod
     def _unjsonify(obj):
         """Reverse ``_jsonify``: convert hex strings back to bytes for raw fields."""
-        if isinstance(obj, dict):
-            if '__special_float__' in obj:
-                import struct as _st
-                return _st.unpack('<d', bytes.fromhex(obj['__special_float__']))[0]
-            result = {}
-            for k, v in obj.items():
-                if k == 'raw' and isinstance(v, str):
-                    try:
-                        result[k] = bytes.fromhex(v)
-                    except ValueError:
-                        result[k] = v
-                else:
-                    result[k] = PlayerLocalData._unjsonify(v)
-            return result
-        if isinstance(obj, list):
-            return [PlayerLocalData._unjsonify(v) for v in obj]
-        return obj
+        return _unjson_safe(obj)
@@ -14,7 +14,8 @@ class BinaryStream:
         self.base_stream = base_stream
 
     def readByte(self):
-        return self.base_stream.read(1)
+        # Returns the byte value as an int (0-255), matching bytes indexing.
+        return self.base_stream.read(1)[0]
 
     def readBytes(self, length):
         return self.base_stream.read(length)
@@ -186,3 +187,176 @@ class BinaryStream:
     def tell(self):
         return self.base_stream.tell()
 
+
+# Pre-compiled Struct instances shared by BufferBinaryStream, so reads
+# skip the format-string parsing done by plain pack/unpack calls.
+_S_I8 = Struct('<b')
+_S_U8 = Struct('<B')
+_S_BOOL = Struct('<?')
+_S_I16 = Struct('<h')
+_S_U16 = Struct('<H')
+_S_I32 = Struct('<i')
+_S_U32 = Struct('<I')
+_S_I64 = Struct('<q')
+_S_U64 = Struct('<Q')
+_S_F32 = Struct('<f')
+_S_F64 = Struct('<d')
+
+
+class ByteArrayBinaryStream(BinaryStream):
+    """Write-only BinaryStream accumulating into a growable bytearray.
+
+    Scalar writes use the pre-compiled Struct instances above instead of
+    per-call format-string parsing, and everything lands in one buffer so
+    the caller can flush to disk with a single file.write.  seek/tell
+    work on a plain int cursor, allowing size back-patching.
+
+    base_stream points back at the instance itself, so callers using the
+    ``stream.base_stream.seek(...)`` idiom hit the cheap int-cursor path.
+    """
+
+    def __init__(self, buf=None):
+        self.buf = bytearray() if buf is None else buf
+        self.pos = len(self.buf)
+        self.base_stream = self
+
+    def writeBytes(self, value):
+        buf = self.buf
+        pos = self.pos
+        end = pos + len(value)
+        if pos == len(buf):
+            buf += value            # common append path
+        else:
+            buf[pos:end] = value    # overwrite (size back-patch)
+        self.pos = end
+
+    def writeChar(self, value):
+        self.writeBytes(_S_I8.pack(value))
+
+    def writeUChar(self, value):
+        self.writeBytes(_S_U8.pack(value))
+
+    def writeBool(self, value):
+        self.writeBytes(_S_BOOL.pack(value))
+
+    def writeInt16(self, value):
+        self.writeBytes(_S_I16.pack(value))
+
+    def writeUInt16(self, value):
+        self.writeBytes(_S_U16.pack(value))
+
+    def writeInt32(self, value):
+        self.writeBytes(_S_I32.pack(value))
+
+    def writeUInt32(self, value):
+        self.writeBytes(_S_U32.pack(value))
+
+    def writeInt64(self, value):
+        self.writeBytes(_S_I64.pack(value))
+
+    def writeUInt64(self, value):
+        self.writeBytes(_S_U64.pack(value))
+
+    def writeFloat(self, value):
+        self.writeBytes(_S_F32.pack(value))
+
+    def writeDouble(self, value):
+        self.writeBytes(_S_F64.pack(value))
+
+    def pack(self, fmt, data):
+        self.writeBytes(pack(fmt, data))
+
+    def seek(self, offset, whence=0):
+        if whence == 0:
+            self.pos = offset
+        elif whence == 1:
+            self.pos += offset
+        else:
+            self.pos = len(self.buf) + offset
+        return self.pos
+
+    def tell(self):
+        return self.pos
+
+
+class BufferBinaryStream(BinaryStream):
+    """Read-only BinaryStream over an in-memory buffer (bytes, mmap, ...).
+
+    Keeps a plain int cursor instead of going through BytesIO/file
+    seek/tell, and unpacks scalars directly from the buffer.  readBytes
+    returns zero-copy memoryview slices; callers that keep the data
+    beyond the buffer's lifetime must convert slices with bytes().
+
+    base_stream points back at the instance itself, so callers using the
+    ``stream.base_stream.seek(...)`` idiom hit the cheap int-cursor path.
+    """
+
+    def __init__(self, buf):
+        self.buf = memoryview(buf)
+        self.pos = 0
+        self.base_stream = self
+
+    def readByte(self):
+        pos = self.pos
+        self.pos = pos + 1
+        return self.buf[pos]
+
+    def readBytes(self, length):
+        pos = self.pos
+        self.pos = pos + length
+        return self.buf[pos:self.pos]
+
+    def readChar(self):
+        return self._unpack_one(_S_I8, 1)
+
+    def readUChar(self):
+        return self._unpack_one(_S_U8, 1)
+
+    def readBool(self):
+        return self._unpack_one(_S_BOOL, 1)
+
+    def readInt16(self):
+        return self._unpack_one(_S_I16, 2)
+
+    def readUInt16(self):
+        return self._unpack_one(_S_U16, 2)
+
+    def readInt32(self):
+        return self._unpack_one(_S_I32, 4)
+
+    def readUInt32(self):
+        return self._unpack_one(_S_U32, 4)
+
+    def readInt64(self):
+        return self._unpack_one(_S_I64, 8)
+
+    def readUInt64(self):
+        return self._unpack_one(_S_U64, 8)
+
+    def readFloat(self):
+        return self._unpack_one(_S_F32, 4)
+
+    def readDouble(self):
+        return self._unpack_one(_S_F64, 8)
+
+    def _unpack_one(self, s, size):
+        pos = self.pos
+        self.pos = pos + size
+        return s.unpack_from(self.buf, pos)[0]
+
+    def unpack(self, fmt, length=1):
+        pos = self.pos
+        self.pos = pos + length
+        return unpack_from(fmt, self.buf, pos)[0]
+
+    def seek(self, offset, whence=0):
+        if whence == 0:
+            self.pos = offset
+        elif whence == 1:
+            self.pos += offset
+        else:
+            self.pos = len(self.buf) + offset
+        return self.pos
+
+    def tell(self):
+        return self.pos